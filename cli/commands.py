@@ -4,7 +4,6 @@ CLI Commands Module
 Implementation of all command functions for the VroomSniffer CLI.
 """
 from typing import Dict, List, Optional, Any, Union, Tuple
-import json
 import sys
 import time
 import random
@@ -12,6 +11,7 @@ from pathlib import Path
 from colorama import Fore, Style, Back
 
 from cli.utils import Services, check_listings_exist, progress_decorator, project_root
+from services.storage_service import write_json_file
 
 
 def list_listings(
@@ -484,10 +484,8 @@ def _run_scraper_with_urls_with_progress(
     if all_listings:
         # Save to the latest_results.json file
         latest_results_path = services.get_path("latest_results")
-        # Use direct json dump as StorageService doesn't have save_to_json method
         Path(latest_results_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(latest_results_path, "w", encoding="utf-8") as f:
-            json.dump(all_listings, f, ensure_ascii=False, indent=2)
+        write_json_file(latest_results_path, all_listings)
         print(f"[+] All URLs processed. Total listings found: {len(all_listings)} ({len(new_listings)} new).")
         
         # Send notifications about new listings if requested
@@ -5,6 +5,7 @@ import json
 from pathlib import Path
 import argparse
 from cli.utils import print_info, print_error, print_success, print_warning
+from services.storage_service import read_json_file
 from colorama import Fore, Style, Back
 
 def display_ip_tracking():
@@ -16,8 +17,7 @@ def display_ip_tracking():
         return
     
     try:
-        with open(ip_tracking_path, "r", encoding="utf-8") as f:
-            tracking_data = json.load(f)
+        tracking_data = read_json_file(ip_tracking_path)
             
         if not tracking_data.get("url_ip_mapping"):
             print_info("No IP tracking data available yet.")
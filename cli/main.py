@@ -26,7 +26,8 @@ from pathlib import Path
 
 # Add the parent directory to the path so we can import from project modules
 project_root = Path(__file__).parent.parent
-sys.path.append(str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.append(str(project_root))
 
 from cli.utils import get_services, load_saved_urls, print_info, print_error, print_success, print_warning
 from colorama import Fore, Back, Style
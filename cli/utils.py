@@ -16,7 +16,8 @@ init(autoreset=True)
 
 # Add the parent directory to the path so we can import from project modules
 project_root = Path(__file__).parent.parent
-sys.path.append(str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.append(str(project_root))
 
 # Import services
 from providers.services_provider import (
@@ -27,6 +28,7 @@ from providers.services_provider import (
     get_url_pool_service,
     get_statistics_service
 )
+from services.storage_service import read_json_file
 
 class CLIError(Exception):
     """Custom exception for CLI-specific errors."""
@@ -109,19 +111,18 @@ def load_saved_urls(services: Services) -> List[str]:
         return []
     
     try:
-        with open(saved_urls_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            
-            # Extract URLs from url_data object instead of urls array
-            url_data = data.get("url_data", {})
-            urls = list(url_data.keys()) if url_data else []
+        data = read_json_file(saved_urls_path)
+        
+        # Extract URLs from url_data object instead of urls array
+        url_data = data.get("url_data", {})
+        urls = list(url_data.keys()) if url_data else []
+        
+        if not urls:
+            print("[!] No URLs found in saved_urls.json")
+            return []
             
-            if not urls:
-                print("[!] No URLs found in saved_urls.json")
-                return []
-                
-            print(f"[*] Loaded {len(urls)} URLs from saved_urls.json")
-            return urls
+        print(f"[*] Loaded {len(urls)} URLs from saved_urls.json")
+        return urls
     except (json.JSONDecodeError, Exception) as e:
         print(f"[!] Error loading saved URLs: {str(e)}")
         return []
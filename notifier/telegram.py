@@ -4,11 +4,34 @@
 
 import requests
 import os
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
 # Load environment variables on import
 load_dotenv()
 
+# Seconds to wait for the Bot API before giving up, so a stalled connection
+# can't hold a send worker indefinitely
+REQUEST_TIMEOUT = 15
+
+# Keep-alive session shared by all sends, so consecutive messages reuse the TLS
+# connection to api.telegram.org; sized for the concurrent senders in
+# NotificationService.manual_send_listings
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=8))
+
+# URL pool used to look up search descriptions; created on first use
+_url_pool_service = None
+
+def _get_url_descriptions():
+    """Get saved URL data from a shared UrlPoolService (re-read only when the file changes)"""
+    global _url_pool_service
+    if _url_pool_service is None:
+        # Import here to avoid circular imports
+        from services.url_pool_service import UrlPoolService
+        _url_pool_service = UrlPoolService()
+    return _url_pool_service.get_url_data()
+
 def _get_telegram_config():
     """Get fresh Telegram configuration from environment variables"""
     # Reload environment variables to pick up any changes
@@ -50,7 +73,7 @@ def send_telegram_message(text, parse_mode=None):
         payload['parse_mode'] = parse_mode
     
     try:
-        response = requests.post(url, data=payload)
+        response = _session.post(url, data=payload, timeout=REQUEST_TIMEOUT)
         try:
             result = response.json()
         except Exception:
@@ -87,10 +110,7 @@ def format_car_listing_message(listing, search_description=None):
     
     # Try to get URL description from listing, or use provided search_description
     if not search_description and source_url:
-        # Import here to avoid circular imports
-        from services.url_pool_service import UrlPoolService
-        url_service = UrlPoolService()
-        url_data = url_service.get_url_data()
+        url_data = _get_url_descriptions()
         
         if source_url in url_data and url_data[source_url].get('description'):
             search_description = url_data[source_url]['description']
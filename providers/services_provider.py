@@ -14,7 +14,9 @@ _storage_service = None
 _url_pool_service = None
 _statistics_service = None
 _notification_service = None
-_scraper_service = None
+# One scraper service per (use_proxy, proxy_type) so switching proxy settings back
+# and forth reuses instances instead of re-running their startup IP check
+_scraper_services = {}
 _scheduler_service = None
 
 def get_storage_service():
@@ -56,14 +58,16 @@ def get_scraper_service(use_proxy=False, proxy_type=None):
     Returns:
         ScraperService: The scraper service instance
     """
-    global _scraper_service
-    if _scraper_service is None or use_proxy:  # Always create new instance when proxy settings change
-        _scraper_service = ScraperService(
+    key = (use_proxy, proxy_type)
+    scraper_service = _scraper_services.get(key)
+    if scraper_service is None:
+        scraper_service = ScraperService(
             get_storage_service(),
             get_url_pool_service(),
             use_proxy=use_proxy,
             proxy_type=proxy_type
         )        # Proxy information is now handled by scraper_service.py
+        _scraper_services[key] = scraper_service
         # Silently configure proxy settings without duplicating logs
         if use_proxy and proxy_type:
             # Just validate the proxy type without printing anything
@@ -76,7 +80,7 @@ def get_scraper_service(use_proxy=False, proxy_type=None):
             except Exception as e:
                 print(f"[!] Error checking proxy configuration: {str(e)}")
     
-    return _scraper_service
+    return scraper_service
 
 def get_scheduler_service():
     """Get or create the scheduler service instance."""
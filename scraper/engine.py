@@ -15,9 +15,10 @@ from urllib.parse import urlparse
 from playwright.sync_api import sync_playwright
 
 # Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
+_root = str(Path(__file__).parent.parent)
+if _root not in sys.path:
+    sys.path.append(_root)
 
-from notifier.telegram import send_telegram_message, format_car_listing_message
 from proxy.manager import ProxyManager, ProxyType
 from scraper.utils import ResourceBlocker, AntiDetection, PageNavigator, ListingsFinder
 
@@ -279,6 +280,10 @@ if __name__ == "__main__":
     
     # Send notifications if requested
     if args.notify and listings:
+        # Imported only here: requests is the heaviest import in this process and
+        # the UI/CLI never pass --notify, so every scrape would pay for it otherwise
+        from notifier.telegram import send_telegram_message, format_car_listing_message
+        
         print(f"[*] Sending Telegram notifications for top {min(args.notify_count, len(listings))} listings...")
         
         for i, listing in enumerate(listings[:args.notify_count]):
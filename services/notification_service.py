@@ -2,9 +2,16 @@
 NotificationService - Handles sending notifications about listings.
 Responsible for sending listings via Telegram and managing notification formats.
 """
+import re
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from notifier.telegram import send_telegram_message, format_car_listing_message
 
+# Telegram rejects messages over 4096 characters; stay below it when combining listings
+MAX_COMBINED_MESSAGE_LENGTH = 4000
+COMBINED_MESSAGE_SEPARATOR = "\n\n━━━━━━━━━━\n\n"
+
 class NotificationService:
     """Service for sending notifications about listings"""
     
@@ -24,10 +31,18 @@ class NotificationService:
             self.send_telegram_message = send_telegram_message
             self.format_car_listing_message = format_car_listing_message
     
-    def manual_send_listings(self, listings, parse_mode="HTML", retry_on_network_error=True, source_url=None, progress_callback=None):
+    def manual_send_listings(self, listings, parse_mode="HTML", retry_on_network_error=True, source_url=None, progress_callback=None, max_concurrency=4, message_interval=1, combine_messages=False):
         """
         Send listings to Telegram, retrying once on network error
         
+        Sends are paced on a fixed schedule (one message per message_interval seconds,
+        with a longer pause between batches) but run on a small worker pool, so a slow request or
+        a retry no longer holds back the messages scheduled after it.
+        
+        With combine_messages, consecutive listings are joined into as few posts as
+        fit Telegram's message length limit, so N listings need far fewer requests
+        (and far less rate-limit pacing) than one message each.
+        
         Args:
             listings: List of listing dictionaries to send
             parse_mode: Telegram parse mode (default "HTML")
@@ -35,6 +50,9 @@ class NotificationService:
             source_url: Optional URL that was used for scraping
             progress_callback: Optional callback function to report progress
                              function(sent_count, total_count, batch_num=None)
+            max_concurrency: Maximum number of messages in flight at once
+            message_interval: Seconds between consecutive sends within a batch
+            combine_messages: Whether to group several listings into one message
             
         Returns:
             tuple: (success_count, failed_list)
@@ -44,82 +62,144 @@ class NotificationService:
         
         # Process listings in batches to avoid rate limiting issues
         batch_size = 15  # Process 15 at a time (20 triggered rate limits)
-        delay_between_msgs = 1  # 1 second between messages
+        delay_between_msgs = message_interval  # 1 second between messages by default
         longer_delay_between_batches = 7  # 7 seconds between batches
         
         total_listings = len(listings)
+        if total_listings == 0:
+            return success_count, failed
+        
+        # Format everything up front so the workers only do network I/O
+        messages = []
+        for listing in listings:
+            # Add source URL to listing if provided and not already present
+            if source_url and not listing.get("source_url"):
+                listing["source_url"] = source_url
+            messages.append(self.format_car_listing_message(listing))
+        
+        # Each post is (listing indices, text); without combining it's one listing per post
+        if combine_messages:
+            posts = self._combine_messages(messages)
+        else:
+            posts = [([index], message) for index, message in enumerate(messages)]
+        
+        # Same pacing as sending one by one: message i starts at a fixed offset
+        batch_span = (batch_size - 1) * delay_between_msgs + longer_delay_between_batches
+        start_time = time.monotonic()
+        
+        # A rate limit pushes back the whole remaining schedule, not just the
+        # message that hit it, so the pool doesn't burst once the wait is over
+        schedule_lock = threading.Lock()
+        schedule_shift = [0.0]
         
-        for batch_start in range(0, total_listings, batch_size):
-            batch_end = min(batch_start + batch_size, total_listings)
-            batch = listings[batch_start:batch_end]
+        def wait_for_slot(offset):
+            while True:
+                with schedule_lock:
+                    ready_at = start_time + offset + schedule_shift[0]
+                wait = ready_at - time.monotonic()
+                if wait <= 0:
+                    return
+                time.sleep(wait)
+        
+        def send_one(post_index):
+            batch_num, position = divmod(post_index, batch_size)
+            wait_for_slot(batch_num * batch_span + position * delay_between_msgs)
+            
+            formatted_msg = posts[post_index][1]
+            success, error = self.send_telegram_message(formatted_msg, parse_mode=parse_mode)
             
-            # Process this batch
-            for i, listing in enumerate(batch):
-                # Add source URL to listing if provided and not already present
-                if source_url and not listing.get("source_url"):
-                    listing["source_url"] = source_url
-                    
-                formatted_msg = self.format_car_listing_message(listing)
-                success, error = self.send_telegram_message(formatted_msg, parse_mode=parse_mode)
+            # Handle errors with intelligent retries
+            if not success and error:
+                retry_wait = 2  # Default retry wait time
+                should_retry = False
                 
-                # Handle errors with intelligent retries
-                if not success and error:
-                    retry_wait = 2  # Default retry wait time
-                    should_retry = False
-                    
-                    # Check if it's a network error
-                    if isinstance(error, str) and ("ConnectionResetError" in error or "Connection aborted" in error) and retry_on_network_error:
-                        should_retry = True
-                    
-                    # Check if it's a rate limit error (dict format)
-                    elif isinstance(error, dict) and error.get("error_code") == 429:
-                        retry_after = error.get("parameters", {}).get("retry_after", 30)
-                        retry_wait = retry_after + 2  # Add a buffer
+                # Check if it's a network error
+                if isinstance(error, str) and ("ConnectionResetError" in error or "Connection aborted" in error or "timed out" in error) and retry_on_network_error:
+                    should_retry = True
+                
+                # Check if it's a rate limit error (dict format)
+                elif isinstance(error, dict) and error.get("error_code") == 429:
+                    retry_after = error.get("parameters", {}).get("retry_after", 30)
+                    retry_wait = retry_after + 2  # Add a buffer
+                    should_retry = True
+                    print(f"[*] Hit Telegram rate limit. Waiting {retry_wait} seconds before retry...")
+                
+                # Check if it's a rate limit error (string format - fallback)
+                elif isinstance(error, str) and "Too Many Requests" in error and "retry after" in error:
+                    # Try to extract retry_after from string
+                    try:
+                        match = re.search(r"retry after (\d+)", error)
+                        if match:
+                            retry_after = int(match.group(1))
+                            retry_wait = retry_after + 2
+                            should_retry = True
+                            print(f"[*] Hit Telegram rate limit (string). Waiting {retry_wait} seconds before retry...")
+                    except Exception:
+                        # Fallback to default wait time
+                        retry_wait = 30
                         should_retry = True
                         print(f"[*] Hit Telegram rate limit. Waiting {retry_wait} seconds before retry...")
-                    
-                    # Check if it's a rate limit error (string format - fallback)
-                    elif isinstance(error, str) and "Too Many Requests" in error and "retry after" in error:
-                        # Try to extract retry_after from string
-                        try:
-                            import re
-                            match = re.search(r"retry after (\d+)", error)
-                            if match:
-                                retry_after = int(match.group(1))
-                                retry_wait = retry_after + 2
-                                should_retry = True
-                                print(f"[*] Hit Telegram rate limit (string). Waiting {retry_wait} seconds before retry...")
-                        except Exception:
-                            # Fallback to default wait time
-                            retry_wait = 30
-                            should_retry = True
-                            print(f"[*] Hit Telegram rate limit. Waiting {retry_wait} seconds before retry...")
-                    
-                    # Perform retry if needed
-                    if should_retry:
-                        time.sleep(retry_wait)
-                        success, error = self.send_telegram_message(formatted_msg, parse_mode=parse_mode)
+                
+                # Perform retry if needed
+                if should_retry:
+                    with schedule_lock:
+                        schedule_shift[0] += retry_wait
+                    time.sleep(retry_wait)
+                    success, error = self.send_telegram_message(formatted_msg, parse_mode=parse_mode)
+            
+            return post_index, success, error
+        
+        processed = 0
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency), thread_name_prefix="telegram") as executor:
+            futures = [executor.submit(send_one, post_index) for post_index in range(len(posts))]
+            
+            # Progress is reported from this thread, so callers may update the UI here
+            for future in as_completed(futures):
+                post_index, success, error = future.result()
+                indices = posts[post_index][0]
+                processed += len(indices)
                 
                 if success:
-                    success_count += 1
+                    success_count += len(indices)
                 else:
-                    failed.append({
-                        'index': batch_start + i + 1,
-                        'title': listing.get('Title', 'Unknown'),
-                        'error': error
-                    })
+                    for index in indices:
+                        failed.append({
+                            'index': index + 1,
+                            'title': listings[index].get('Title', 'Unknown'),
+                            'error': error
+                        })
                 
-                # Add delay between messages (except for the last one in the batch)
-                if i < len(batch) - 1:
-                    time.sleep(delay_between_msgs)
-            
-            # Add a longer pause between batches (except after the last batch)
-            if batch_end < total_listings:
-                print(f"[*] Processed {batch_end}/{total_listings} listings. Pausing to avoid rate limits...")
-                time.sleep(longer_delay_between_batches)
+                if progress_callback:
+                    progress_callback(processed, total_listings, post_index // batch_size + 1)
         
+        failed.sort(key=lambda item: item['index'])
         return success_count, failed
     
+    def _combine_messages(self, messages):
+        """
+        Group formatted messages into posts that fit Telegram's length limit
+        
+        Args:
+            messages: List of formatted listing messages
+            
+        Returns:
+            list: (listing indices, combined text) tuples, in listing order
+        """
+        posts = []
+        indices, parts, length = [], [], 0
+        for index, message in enumerate(messages):
+            added = len(message) + (len(COMBINED_MESSAGE_SEPARATOR) if parts else 0)
+            if parts and length + added > MAX_COMBINED_MESSAGE_LENGTH:
+                posts.append((indices, COMBINED_MESSAGE_SEPARATOR.join(parts)))
+                indices, parts, length = [], [], 0
+                added = len(message)
+            indices.append(index)
+            parts.append(message)
+            length += added
+        if parts:
+            posts.append((indices, COMBINED_MESSAGE_SEPARATOR.join(parts)))
+        return posts
+    
     def send_listing(self, listing, source_url=None):
         """
         Send a single listing via Telegram
@@ -150,16 +230,13 @@ class NotificationService:
         Returns:
             int: Number of successfully sent messages
         """
-        success_count = 0
-        for i, listing in enumerate(listings):
-            success = self.send_listing(listing)
-            if success:
-                success_count += 1
-                
-            # Add delay between messages, except for the last one
-            if i < len(listings) - 1:
-                time.sleep(delay_seconds)
-                
+        # Same paced worker pool as manual sends; plain text like send_listing
+        success_count, _ = self.manual_send_listings(
+            listings,
+            parse_mode=None,
+            retry_on_network_error=False,
+            message_interval=delay_seconds
+        )
         return success_count
     
     def send_summary_notification(self, listings, search_keyword="", max_preview=3):
@@ -16,7 +16,8 @@ class SchedulerService:
     def __init__(self):
         """Initialize with default values"""
         self.interval_seconds = self.DEFAULT_INTERVAL
-        self.last_scrape_time = 0
+        # Scrape times use time.monotonic() so wall-clock changes can't stall the schedule
+        self.last_scrape_time = float('-inf')
         self.scraping_active = False
         self.next_url_index = 0
         self.next_url_selected = False
@@ -58,7 +59,7 @@ class SchedulerService:
         if not self.scraping_active:
             return False
             
-        elapsed = time.time() - self.last_scrape_time
+        elapsed = time.monotonic() - self.last_scrape_time
         return elapsed >= self.interval_seconds
     
     def start_scraping(self):
@@ -69,7 +70,7 @@ class SchedulerService:
             bool: True if successfully started
         """
         self.scraping_active = True
-        self.last_scrape_time = 0  # Force immediate first scrape
+        self.last_scrape_time = float('-inf')  # Force immediate first scrape
         self.next_url_selected = False
         return True
     
@@ -94,7 +95,7 @@ class SchedulerService:
         Returns:
             int: The updated total run count
         """
-        self.last_scrape_time = time.time()
+        self.last_scrape_time = time.monotonic()
         self.total_runs += 1
         return self.total_runs
     
@@ -120,12 +121,13 @@ class SchedulerService:
         Calculate the timestamp of the next scheduled scrape
         
         Returns:
-            float: Unix timestamp of the next scrape time
+            float: time.time() timestamp of the next scrape time (now if a scrape is due)
         """
         if not self.scraping_active:
             return 0
         
-        return self.last_scrape_time + self.interval_seconds
+        # Scheduling runs on the monotonic clock; convert the remaining wait to wall-clock time
+        return time.time() + self.get_time_until_next_scrape()
     
     # Simplified method to support display in UI
     def get_max_runs(self):
@@ -155,7 +157,7 @@ class SchedulerService:
         if not self.scraping_active:
             return 0
             
-        elapsed = time.time() - self.last_scrape_time
+        elapsed = time.monotonic() - self.last_scrape_time
         remaining = self.interval_seconds - elapsed
         return max(0, remaining)
     def get_progress_percentage(self):
@@ -2,9 +2,10 @@
 StatisticsService - Handles listing analysis and statistics.
 Responsible for extracting prices, calculating statistics and providing search functionality.
 """
-import re
+import numpy as np
 import pandas as pd
 from pathlib import Path
+from services.storage_service import parse_price
 
 class StatisticsService:
     """Service for analyzing listings and generating statistics"""
@@ -35,10 +36,9 @@ class StatisticsService:
         """
         prices = []
         for item in listings:
-            price_str = item.get("Price", "").replace(".", "").replace(",", "").replace("€", "").strip()
-            match = re.search(r"\d+", price_str)
-            if match:
-                prices.append(int(match.group()))
+            price = parse_price(item.get("Price", ""))
+            if price is not None:
+                prices.append(price)
         return prices
     
     def show_statistics(self, listings_data):
@@ -123,16 +123,14 @@ class StatisticsService:
         Returns:
             DataFrame with price ranges and counts
         """
-        df_prices = pd.DataFrame({"Price": prices})
-        
-        # Create bins for better visualization
-        hist_data = pd.cut(df_prices["Price"], bins=bins, include_lowest=True)
-        hist_counts = hist_data.value_counts().sort_index()
+        # np.histogram bins the whole array in one pass instead of building a
+        # Categorical of Interval objects with pd.cut
+        counts, edges = np.histogram(np.asarray(prices, dtype=np.float64), bins=bins)
         
         # Convert to chart-friendly format
         chart_data = pd.DataFrame({
-            'Price Range': [f"€{int(interval.left):,}-€{int(interval.right):,}" for interval in hist_counts.index],
-            'Count': hist_counts.values
+            'Price Range': [f"€{int(left):,}-€{int(right):,}" for left, right in zip(edges[:-1], edges[1:])],
+            'Count': counts
         })
         
         return chart_data
@@ -164,9 +162,10 @@ class StatisticsService:
         Returns:
             Dictionary with counts by category
         """
-        low_price = len([p for p in prices if p < 10000])
-        mid_price = len([p for p in prices if 10000 <= p < 25000])
-        high_price = len([p for p in prices if p >= 25000])
+        price_array = np.asarray(prices)
+        low_price = int(np.count_nonzero(price_array < 10000))
+        high_price = int(np.count_nonzero(price_array >= 25000))
+        mid_price = len(prices) - low_price - high_price
         
         return {
             'low': low_price,
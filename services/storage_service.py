@@ -7,6 +7,41 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson is optional - fall back to the stdlib parser
+    orjson = None
+
+# First number in a price string, including thousands separators ("12.500 € VB")
+_PRICE_NUMBER_RE = re.compile(r"\d[\d.,€]*")
+_PRICE_SEPARATORS_RE = re.compile(r"[.,€]")
+
+
+def read_json_file(path):
+    """Parse a JSON file, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_json_file(path, data):
+    """Write data as indented UTF-8 JSON, using orjson when it is installed"""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def parse_price(price_str):
+    """Parse the first number in a listing price string ("12.500 € VB" -> 12500), or None"""
+    match = _PRICE_NUMBER_RE.search(price_str)
+    if match:
+        return int(_PRICE_SEPARATORS_RE.sub("", match.group()))
+    return None
+
+
 class StorageService:
     """Service for handling all storage operations"""
     
@@ -17,6 +52,8 @@ class StorageService:
         self.ip_tracking_path = str(Path(__file__).parent.parent / "storage" / "ip_tracking.json")
         self.detection_events_path = str(Path(__file__).parent.parent / "storage" / "detection_events.json")
         self.bandwidth_tracking_path = str(Path(__file__).parent.parent / "storage" / "bandwidth_tracking.json")
+        # path -> (mtime_ns, size, count) so unchanged files are never re-parsed just to count
+        self._count_cache = {}
     
     def load_cache(self, cache_path=None):
         """
@@ -36,34 +73,82 @@ class StorageService:
                 if Path(path).stat().st_size == 0:
                     return {}
                     
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    # Handle both old filter-based format and new URL-based format
-                    if isinstance(data, dict) and data:
-                        first_key = next(iter(data.keys()))
-                        if first_key.startswith('http'):
-                            return data  # Already URL-based
-                        # Convert old format to URL-based
-                        url_cache = {}
-                        for filter_listings in data.values():
-                            if isinstance(filter_listings, list):
-                                for listing in filter_listings:
-                                    if listing.get("URL"):
-                                        url_cache[listing["URL"]] = listing
-                        return url_cache
-                    elif isinstance(data, list):
-                        # Handle list format (legacy)
-                        url_cache = {}
-                        for listing in data:
-                            if listing.get("URL"):
-                                url_cache[listing["URL"]] = listing
-                        return url_cache
-                    return {}
+                data = read_json_file(path)
+                return self._to_url_cache(data)
             except (json.JSONDecodeError, Exception):
                 # If file is corrupted or empty, return empty dict
                 return {}
         return {}
     
+    def _to_url_cache(self, data):
+        """
+        Normalize raw cache file contents to a URL-indexed dictionary
+        
+        Args:
+            data: Decoded JSON (URL-based dict, legacy filter-based dict or legacy list)
+            
+        Returns:
+            dict: URL-indexed cache of listings
+        """
+        # Handle both old filter-based format and new URL-based format
+        if isinstance(data, dict) and data:
+            first_key = next(iter(data.keys()))
+            if first_key.startswith('http'):
+                return data  # Already URL-based
+            # Convert old format to URL-based
+            url_cache = {}
+            for filter_listings in data.values():
+                if isinstance(filter_listings, list):
+                    for listing in filter_listings:
+                        if listing.get("URL"):
+                            url_cache[listing["URL"]] = listing
+            return url_cache
+        elif isinstance(data, list):
+            # Handle list format (legacy)
+            url_cache = {}
+            for listing in data:
+                if listing.get("URL"):
+                    url_cache[listing["URL"]] = listing
+            return url_cache
+        return {}
+    
+    def count_listings(self, cache_path=None):
+        """
+        Count listings in a cache file without building the URL-indexed cache
+        
+        Args:
+            cache_path: Path to the cache file (uses self.all_old_path if not provided)
+            
+        Returns:
+            int: Number of listings in the cache, 0 if missing or unreadable
+        """
+        path = cache_path or self.all_old_path
+        try:
+            stat_result = Path(path).stat()
+        except OSError:
+            self._count_cache.pop(str(path), None)
+            return 0
+        if stat_result.st_size == 0:
+            return 0
+        
+        signature = (stat_result.st_mtime_ns, stat_result.st_size)
+        cached = self._count_cache.get(str(path))
+        if cached is not None and cached[:2] == signature:
+            return cached[2]
+        
+        try:
+            data = read_json_file(path)
+            # URL-based caches hold one listing per top-level key
+            if isinstance(data, dict) and data and next(iter(data)).startswith('http'):
+                count = len(data)
+            else:
+                count = len(self._to_url_cache(data))
+        except Exception:
+            return 0
+        
+        self._count_cache[str(path)] = (*signature, count)
+        return count
+    
     def save_cache(self, cache_dict, cache_path=None):
         """
         Save URL-indexed cache dictionary
@@ -74,8 +159,7 @@ class StorageService:
         """
         path = cache_path or self.all_old_path
         Path(path).parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(cache_dict, f, ensure_ascii=False, indent=2)
+        write_json_file(path, cache_dict)
     
     def is_listing_cached(self, url, cache_path=None):
         """
@@ -229,7 +313,9 @@ class StorageService:
                 del cache[url]
                 removed_count += 1
         
-        self.save_cache(cache, path)
+        # Nothing matched, so the file doesn't need rewriting
+        if removed_count:
+            self.save_cache(cache, path)
         return removed_count
     
     def clear_all_caches(self, root_dir=None):
@@ -264,8 +350,7 @@ class StorageService:
                     # Clear the file by writing empty dict or list
                     if "latest_results.json" in cache_file:
                         # This is scraped results, write empty list
-                        with open(file_path, "w", encoding="utf-8") as f:
-                            json.dump([], f, ensure_ascii=False, indent=2)
+                        write_json_file(file_path, [])
                     else:
                         # This is cache file, write empty dict
                         self.save_cache({}, str(file_path))
@@ -313,10 +398,8 @@ class StorageService:
         if min_price is not None or max_price is not None:
             price_filtered = []
             for listing in filtered:
-                price_str = listing.get("Price", "").replace(".", "").replace(",", "").replace("€", "").strip()
-                match = re.search(r"\d+", price_str)
-                if match:
-                    price = int(match.group())
+                price = parse_price(listing.get("Price", ""))
+                if price is not None:
                     if min_price is not None and price < min_price:
                         continue
                     if max_price is not None and price > max_price:
@@ -345,8 +428,7 @@ class StorageService:
         # Load existing data or create new structure
         try:
             if Path(path).exists():
-                with open(path, "r", encoding="utf-8") as f:
-                    tracking_data = json.load(f)
+                tracking_data = read_json_file(path)
             else:
                 tracking_data = {"url_ip_mapping": {}, "last_updated": ""}
         except json.JSONDecodeError:
@@ -364,11 +446,17 @@ class StorageService:
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         # Check if the same IP has been used before for this URL to avoid duplicates
-        for entry in tracking_data["url_ip_mapping"][url]:
+        ip_entries = tracking_data["url_ip_mapping"][url]
+        # Files written before entries were kept in last-use order are sorted once here
+        ip_entries.sort(key=lambda entry: entry.get("last_used", ""))
+        for entry in ip_entries:
             if entry.get("ip") == ip and entry.get("is_proxy") == is_proxy:
                 # Update the existing entry with new timestamp
                 entry["last_used"] = timestamp
                 entry["use_count"] = entry.get("use_count", 1) + 1
+                # Keep entries ordered by last use so the newest one is always last
+                ip_entries.remove(entry)
+                ip_entries.append(entry)
                 break
         else:  # This else belongs to the for loop (executes if no break)
             # Add new IP entry
@@ -384,8 +472,7 @@ class StorageService:
         tracking_data["last_updated"] = timestamp
         
         # Save updated data
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(tracking_data, f, ensure_ascii=False, indent=2)
+        write_json_file(path, tracking_data)
             
         return tracking_data
     
@@ -404,9 +491,8 @@ class StorageService:
         
         try:
             if Path(path).exists():
-                with open(path, "r", encoding="utf-8") as f:
-                    tracking_data = json.load(f)
-                    return tracking_data.get("url_ip_mapping", {}).get(url, [])
+                tracking_data = read_json_file(path)
+                return tracking_data.get("url_ip_mapping", {}).get(url, [])
             return []
         except (json.JSONDecodeError, Exception):
             return []
@@ -425,9 +511,8 @@ class StorageService:
         
         try:
             if Path(path).exists():
-                with open(path, "r", encoding="utf-8") as f:
-                    tracking_data = json.load(f)
-                    return tracking_data
+                tracking_data = read_json_file(path)
+                return tracking_data
             return {"url_ip_mapping": {}, "last_updated": ""}
         except (json.JSONDecodeError, Exception):
             return {"url_ip_mapping": {}, "last_updated": ""}
@@ -449,8 +534,7 @@ class StorageService:
         # Load existing data or create new structure
         try:
             if Path(path).exists():
-                with open(path, "r", encoding="utf-8") as f:
-                    tracking_data = json.load(f)
+                tracking_data = read_json_file(path)
             else:
                 tracking_data = {"url_bandwidth_mapping": {}}
         except json.JSONDecodeError:
@@ -486,8 +570,7 @@ class StorageService:
         
         # Save updated data
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(tracking_data, f, indent=2, ensure_ascii=False)
+            write_json_file(path, tracking_data)
         except Exception as e:
             print(f"[!] Warning: Could not save bandwidth tracking: {e}")
     
@@ -505,8 +588,7 @@ class StorageService:
         
         try:
             if Path(path).exists():
-                with open(path, "r", encoding="utf-8") as f:
-                    tracking_data = json.load(f)
+                tracking_data = read_json_file(path)
                     
                 url_data = tracking_data.get("url_bandwidth_mapping", {}).get(url, [])
                 if url_data:
@@ -562,8 +644,7 @@ class StorageService:
         # Load existing data
         try:
             if Path(path).exists():
-                with open(path, "r", encoding="utf-8") as f:
-                    tracking_data = json.load(f)
+                tracking_data = read_json_file(path)
             else:
                 tracking_data = {"url_ip_mapping": {}, "last_updated": ""}
         except json.JSONDecodeError:
@@ -575,6 +656,9 @@ class StorageService:
         if url not in tracking_data["url_ip_mapping"]:
             tracking_data["url_ip_mapping"][url] = []
         
+        # Files written before entries were kept in last-use order are sorted once here
+        tracking_data["url_ip_mapping"][url].sort(key=lambda entry: entry.get("last_used", ""))
+        
         # Find or create IP entry
         ip_entry = None
         for entry in tracking_data["url_ip_mapping"][url]:
@@ -599,13 +683,15 @@ class StorageService:
             if success:
                 ip_entry["success_count"] = ip_entry.get("success_count", 0) + 1
             ip_entry["total_listings"] = ip_entry.get("total_listings", 0) + listings_found
+            # Keep entries ordered by last use so the newest one is always last
+            tracking_data["url_ip_mapping"][url].remove(ip_entry)
+            tracking_data["url_ip_mapping"][url].append(ip_entry)
         
         # Update metadata
         tracking_data["last_updated"] = current_time
         
         # Save updated data
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(tracking_data, f, ensure_ascii=False, indent=2)
+        write_json_file(path, tracking_data)
     
     def _track_detection_event_separate(self, url, ip, is_proxy, detection_type, page_title, 
                                       success, listings_found, response_time, trigger_indicator=None):
@@ -615,8 +701,7 @@ class StorageService:
         # Load existing detection events
         try:
             if Path(self.detection_events_path).exists():
-                with open(self.detection_events_path, "r", encoding="utf-8") as f:
-                    events_data = json.load(f)
+                events_data = read_json_file(self.detection_events_path)
             else:
                 events_data = {"detection_events": [], "last_updated": ""}
         except json.JSONDecodeError:
@@ -649,8 +734,7 @@ class StorageService:
         events_data["last_updated"] = current_time
         
         # Save detection events
-        with open(self.detection_events_path, "w", encoding="utf-8") as f:
-            json.dump(events_data, f, ensure_ascii=False, indent=2)
+        write_json_file(self.detection_events_path, events_data)
     
     def _get_real_ip_for_detection_event(self, original_ip, is_proxy):
         """Get real IP address for detection events only"""
@@ -2,10 +2,10 @@
 UrlPoolService - Handles management of URL pools for scraping.
 Responsible for saving, loading, adding and removing URLs from storage.
 """
-import json
 import time
 import random
 from pathlib import Path
+from services.storage_service import read_json_file, write_json_file
 
 class UrlPoolService:
     """Service for managing URL pools for scraping"""
@@ -16,6 +16,8 @@ class UrlPoolService:
             self.url_storage_path = url_storage_path
         else:
             self.url_storage_path = str(Path(__file__).parent.parent / "storage" / "saved_urls.json")
+        # (mtime_ns, size, url_data) of the last get_url_data() read
+        self._url_data_cache = None
     
     def get_url_storage_path(self):
         """Get the path for URL storage file"""
@@ -31,15 +33,14 @@ class UrlPoolService:
         try:
             url_file = Path(self.url_storage_path)
             if url_file.exists():
-                with open(url_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # Handle both old and new format
-                    if 'urls' in data:
-                        # Old format - simple list
-                        return data.get('urls', [])
-                    elif 'url_data' in data:
-                        # New format - return just the URLs as a list
-                        return list(data.get('url_data', {}).keys())
+                data = read_json_file(url_file)
+                # Handle both old and new format
+                if 'urls' in data:
+                    # Old format - simple list
+                    return data.get('urls', [])
+                elif 'url_data' in data:
+                    # New format - return just the URLs as a list
+                    return list(data.get('url_data', {}).keys())
         except Exception as e:
             pass
         return []
@@ -54,25 +55,24 @@ class UrlPoolService:
         try:
             url_file = Path(self.url_storage_path)
             if url_file.exists():
-                with open(url_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if 'url_data' in data:
-                        # New format
-                        return data.get('url_data', {})
-                    elif 'urls' in data:
-                        # Legacy format - convert it
-                        urls = data.get('urls', [])
-                        url_data = {}
-                        for url in urls:
-                            url_data[url] = {
-                                'description': '',
-                                'stats': {
-                                    'run_count': 0,
-                                    'total_listings': 0,
-                                    'last_run': None
-                                }
+                data = read_json_file(url_file)
+                if 'url_data' in data:
+                    # New format
+                    return data.get('url_data', {})
+                elif 'urls' in data:
+                    # Legacy format - convert it
+                    urls = data.get('urls', [])
+                    url_data = {}
+                    for url in urls:
+                        url_data[url] = {
+                            'description': '',
+                            'stats': {
+                                'run_count': 0,
+                                'total_listings': 0,
+                                'last_run': None
                             }
-                        return url_data
+                        }
+                    return url_data
         except Exception as e:
             pass
         return {}
@@ -122,8 +122,10 @@ class UrlPoolService:
                     'last_updated': time.strftime('%Y-%m-%d %H:%M:%S')
                 }
             
-            with open(url_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            write_json_file(url_file, data)
+            # Every writer goes through here; don't rely on the file signature
+            # alone, which can miss a rewrite within the filesystem's mtime resolution
+            self._url_data_cache = None
             return True
         except Exception as e:
             return False
@@ -269,10 +271,22 @@ class UrlPoolService:
         """
         Get the complete URL data including metadata and statistics
         
+        The file is only re-read when it changes; each call returns a shallow copy,
+        so use the update/add/remove methods to modify URL data.
+        
         Returns:
             dict: Dictionary of URLs with their metadata and statistics
         """
-        return self._load_saved_url_data()
+        try:
+            stat_result = Path(self.url_storage_path).stat()
+        except OSError:
+            self._url_data_cache = None
+            return {}
+        
+        signature = (stat_result.st_mtime_ns, stat_result.st_size)
+        if self._url_data_cache is None or self._url_data_cache[:2] != signature:
+            self._url_data_cache = (*signature, self._load_saved_url_data())
+        return dict(self._url_data_cache[2])
     
     def update_url_description(self, url, description):
         """
@@ -0,0 +1,37 @@
+"""
+Cached loaders for the storage files shared by the VroomSniffer UI pages.
+
+Every loader takes the file's signature from file_signature() as part of its
+cache key, so a file is parsed once per version no matter how many pages or
+reruns read it.
+"""
+import os
+import streamlit as st
+
+from providers.services_provider import get_storage_service
+from services.storage_service import read_json_file
+
+def file_signature(path):
+    """Return (st_mtime_ns, st_size) for a file from a single stat call, or None if it is missing."""
+    if not path:
+        return None
+    try:
+        stat_result = os.stat(path)
+    except (OSError, TypeError):
+        return None
+    return (stat_result.st_mtime_ns, stat_result.st_size)
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def load_all_listings(cache_path, signature):
+    """Load all cached listings; the signature is part of the cache key so writes invalidate it."""
+    return get_storage_service().get_all_cached_listings(cache_path)
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def load_cache_stats(cache_path, signature):
+    """Cache overview stats, recomputed only when the cache file changes."""
+    return get_storage_service().get_cache_stats(cache_path)
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def load_ip_tracking(path, signature):
+    """Load ip_tracking.json, re-read only when the file changes."""
+    return read_json_file(path)
@@ -5,6 +5,64 @@ import streamlit as st
 import pandas as pd
 from pathlib import Path
 import json
+from ui.components.cached_data import file_signature, load_ip_tracking
+
+# Path to IP tracking file
+_IP_TRACKING_PATH = Path(__file__).resolve().parent.parent.parent / "storage" / "ip_tracking.json"
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _ip_tracking_frames(path, signature):
+    """
+    Build the tables shown by display_ip_tracking once per version of the file.
+    
+    The tab and every per-URL expander body run on each rerun even when hidden,
+    so the DataFrames are built here instead of inside them.
+    
+    Returns:
+        tuple: (tracking_data, url_frames, summary_frame) where url_frames is a list of
+               (url, direct_frame, proxy_frame) and missing tables are None
+    """
+    tracking_data = load_ip_tracking(path, signature)
+    url_ip_mapping = tracking_data.get("url_ip_mapping", {})
+    
+    url_frames = []
+    for url, ip_entries in url_ip_mapping.items():
+        # Filter entries by type
+        direct_ips = [entry for entry in ip_entries if not entry.get("is_proxy")]
+        proxy_ips = [entry for entry in ip_entries if entry.get("is_proxy")]
+        url_frames.append((
+            url,
+            pd.DataFrame(direct_ips) if direct_ips else None,
+            pd.DataFrame(proxy_ips) if proxy_ips else None
+        ))
+    
+    # IP summary view - show unique IPs and how many URLs they were used for
+    all_ips = {}
+    
+    for url, ip_entries in url_ip_mapping.items():
+        for entry in ip_entries:
+            ip = entry.get("ip")
+            is_proxy = entry.get("is_proxy")
+            
+            if ip not in all_ips:
+                all_ips[ip] = {
+                    "ip": ip,
+                    "is_proxy": is_proxy,
+                    "urls": [url],
+                    "total_uses": entry.get("use_count", 1)
+                }
+            else:
+                all_ips[ip]["urls"].append(url)
+                all_ips[ip]["total_uses"] += entry.get("use_count", 1)
+    
+    # Convert to list for DataFrame
+    ip_summary_list = list(all_ips.values())
+    for item in ip_summary_list:
+        item["url_count"] = len(set(item["urls"]))  # Count unique URLs
+        item["urls"] = ", ".join(set(item["urls"]))  # Convert to string
+    
+    summary_frame = pd.DataFrame(ip_summary_list) if ip_summary_list else None
+    return tracking_data, url_frames, summary_frame
 
 def display_ip_tracking():
     """
@@ -14,17 +72,16 @@ def display_ip_tracking():
     """
     st.subheader("IP Tracking")
     
-    # Path to IP tracking file
-    ip_tracking_path = Path(__file__).parent.parent.parent / "storage" / "ip_tracking.json"
-    
-    if not ip_tracking_path.exists():
+    ip_tracking_signature = file_signature(_IP_TRACKING_PATH)
+    if ip_tracking_signature is None:
         st.info("No IP tracking data available yet. Run scrapes to start collecting IP data.")
         return
     
     try:
-        # Load the IP tracking data
-        with open(ip_tracking_path, "r", encoding="utf-8") as f:
-            tracking_data = json.load(f)
+        # Load the IP tracking data and its tables (rebuilt only when the file changes)
+        tracking_data, url_frames, summary_frame = _ip_tracking_frames(
+            str(_IP_TRACKING_PATH), ip_tracking_signature
+        )
         
         if not tracking_data.get("url_ip_mapping"):
             st.info("No IP tracking data available yet. Run scrapes to start collecting IP data.")
@@ -38,60 +95,28 @@ def display_ip_tracking():
         
         with tab1:
             # URL-centric view
-            for url, ip_entries in tracking_data.get("url_ip_mapping", {}).items():
+            for url, df_direct, df_proxy in url_frames:
                 with st.expander(f"{url}"):
                     # Create two columns for direct and proxy IPs
                     col1, col2 = st.columns(2)
                     
-                    # Filter entries by type
-                    direct_ips = [entry for entry in ip_entries if not entry.get("is_proxy")]
-                    proxy_ips = [entry for entry in ip_entries if entry.get("is_proxy")]
-                    
                     with col1:
                         st.write("**Direct IPs:**")
-                        if direct_ips:
-                            df_direct = pd.DataFrame(direct_ips)
+                        if df_direct is not None:
                             st.dataframe(df_direct, hide_index=True)
                         else:
                             st.write("No direct IPs recorded")
                     
                     with col2:
                         st.write("**Proxy IPs:**")
-                        if proxy_ips:
-                            df_proxy = pd.DataFrame(proxy_ips)
+                        if df_proxy is not None:
                             st.dataframe(df_proxy, hide_index=True)
                         else:
                             st.write("No proxy IPs recorded")
         
         with tab2:
-            # IP summary view - show unique IPs and how many URLs they were used for
-            all_ips = {}
-            
-            for url, ip_entries in tracking_data.get("url_ip_mapping", {}).items():
-                for entry in ip_entries:
-                    ip = entry.get("ip")
-                    is_proxy = entry.get("is_proxy")
-                    
-                    if ip not in all_ips:
-                        all_ips[ip] = {
-                            "ip": ip,
-                            "is_proxy": is_proxy,
-                            "urls": [url],
-                            "total_uses": entry.get("use_count", 1)
-                        }
-                    else:
-                        all_ips[ip]["urls"].append(url)
-                        all_ips[ip]["total_uses"] += entry.get("use_count", 1)
-            
-            # Convert to list for DataFrame
-            ip_summary_list = list(all_ips.values())
-            for item in ip_summary_list:
-                item["url_count"] = len(set(item["urls"]))  # Count unique URLs
-                item["urls"] = ", ".join(set(item["urls"]))  # Convert to string
-            
-            if ip_summary_list:
-                df_summary = pd.DataFrame(ip_summary_list)
-                st.dataframe(df_summary, hide_index=True)
+            if summary_frame is not None:
+                st.dataframe(summary_frame, hide_index=True)
             else:
                 st.write("No IP data available")
                 
@@ -1,6 +1,7 @@
 """
 Reusable metrics components for the VroomSniffer UI.
 """
+import html
 import streamlit as st
 
 def display_metrics_row(metrics_data, num_columns=4):
@@ -28,6 +29,24 @@ def display_metrics_row(metrics_data, num_columns=4):
     # Return any unfilled columns
     return columns[len(metrics_data) % num_columns:]
 
+def display_metrics_card(metrics_data):
+    """
+    Display a row of metrics as a single HTML element
+    
+    Renders the same label/value pairs as display_metrics_row, but as one
+    markdown element instead of one st.metric widget per column. Use this
+    for frequently rerun sections where the metrics rarely change.
+    
+    Args:
+        metrics_data: List of dicts with 'label' and 'value' keys
+    """
+    items = "".join(
+        f'<div class="metric-card-item"><span class="metric-card-label">{html.escape(str(m.get("label", "")))}</span>'
+        f'<span class="metric-card-value">{html.escape(str(m.get("value", "")))}</span></div>'
+        for m in metrics_data
+    )
+    st.markdown(f'<div class="metric-card-row">{items}</div>', unsafe_allow_html=True)
+
 def display_system_stats(stats, total_runs=None):
     """
     Display system stats consistently across pages
@@ -24,8 +24,8 @@ def create_navigation_card(title, description, bullet_points, target_page, is_pr
     
     # Navigation button
     button_type = "primary" if is_primary else "secondary"
-    if st.button(f"Go to {title}", type=button_type, use_container_width=True):
-        navigate_to(target_page)
+    st.button(f"Go to {title}", type=button_type, use_container_width=True,
+              on_click=navigate_to, args=(target_page,))
 
 def create_navigation_cards(cards_data):
     """
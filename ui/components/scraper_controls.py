@@ -2,55 +2,74 @@
 Scraper control components for the VroomSniffer UI.
 """
 import os
-import time
 import streamlit as st
-import requests
 from dotenv import load_dotenv
 from ui.components.sound_effects import play_sound
 from proxy.manager import ProxyManager, ProxyType
 
+def _start_scraping(scheduler_service):
+    """
+    on_click callback for the Start button.
+    
+    Callbacks run before the page is drawn, so the same run already shows the
+    Stop button and the updated status. The message is left in session state
+    for the controls to show.
+    
+    Args:
+        scheduler_service: Instance of SchedulerService
+    """
+    if not st.session_state.url_pool:
+        st.session_state._scraper_control_message = ("error", "Add URLs first")
+        return
+    
+    scheduler_service.start_scraping()
+    # Pre-select first URL using scheduler service
+    random_selection = st.session_state.get('random_url_selection', True)
+    scheduler_service.select_next_url_index(
+        url_count=len(st.session_state.url_pool),
+        random_selection=random_selection,
+        current_run=scheduler_service.get_total_runs()
+    )
+    st.session_state._scraper_control_message = ("success", "Started")
+    play_sound("Vroom 1.mp3")
+
+def _stop_scraping(scheduler_service):
+    """on_click callback for the Stop button; see _start_scraping."""
+    scheduler_service.stop_scraping()
+    st.session_state._scraper_control_message = ("success", "Stopped")
+
 def display_scraper_controls(scheduler_service):
     """
     Display simplified scraper control interface.
     
     Args:
         scheduler_service: Instance of SchedulerService
-        
-    Returns:
-        True if any setting was changed, False otherwise
     """
     st.subheader("Controls")
     
     # Simplified controls layout
     col1, col2, col3 = st.columns([1.5, 2, 1.5])
-    changed = False
     
     with col1:
         if not scheduler_service.is_scraping_active():
-            if st.button("▶️ Start", type="primary", use_container_width=True):
-                if st.session_state.url_pool:
-                    scheduler_service.start_scraping()
-                    # Pre-select first URL using scheduler service
-                    random_selection = st.session_state.get('random_url_selection', True)
-                    scheduler_service.select_next_url_index(
-                        url_count=len(st.session_state.url_pool),
-                        random_selection=random_selection,
-                        current_run=scheduler_service.get_total_runs()
-                    )
-                    
-                    st.success("Started")
-                    play_sound("Vroom 1.mp3")
-                    changed = True
-                else:
-                    st.error("Add URLs first")
+            st.button("▶️ Start", type="primary", use_container_width=True,
+                      on_click=_start_scraping, args=(scheduler_service,))
         else:
-            if st.button("⏹️ Stop", use_container_width=True):
-                scheduler_service.stop_scraping()
-                st.success("Stopped")
-                changed = True
+            st.button("⏹️ Stop", use_container_width=True,
+                      on_click=_stop_scraping, args=(scheduler_service,))
+        
+        # Outcome of a Start/Stop click in this run
+        message = st.session_state.pop('_scraper_control_message', None)
+        if message is not None:
+            level, text = message
+            if level == "error":
+                st.error(text)
+            else:
+                st.success(text)
     
-    with col2:        # Store previous state to detect changes
+    with col2:        # Current settings, used as the defaults of the widgets below
         prev_auto_send = st.session_state.get('auto_send_active', False)
+        prev_combine_messages = st.session_state.get('combine_messages', False)
         prev_sound_effects = st.session_state.get('sound_effects_enabled', False)
         prev_random_selection = st.session_state.get('random_url_selection', True)
         prev_use_proxy = st.session_state.get('use_proxy', False)
@@ -60,6 +79,10 @@ def display_scraper_controls(scheduler_service):
         with st.expander("Advanced Settings"):
             # Existing settings
             st.session_state.auto_send_active = st.toggle("Auto-send new findings", prev_auto_send)
+            st.session_state.combine_messages = st.toggle(
+                "Combine notifications", prev_combine_messages,
+                help="Send several listings per Telegram message instead of one message each"
+            )
             st.session_state.sound_effects_enabled = st.toggle("Sound effects", prev_sound_effects)
             st.session_state.random_url_selection = st.toggle("Random URL selection", prev_random_selection)
             
@@ -92,13 +115,6 @@ def display_scraper_controls(scheduler_service):
                         verify_webshare_proxy()
             else:
                 st.session_state.proxy_type = "NONE"
-                
-        if (prev_auto_send != st.session_state.auto_send_active or 
-            prev_sound_effects != st.session_state.sound_effects_enabled or
-            prev_random_selection != st.session_state.random_url_selection or
-            prev_use_proxy != st.session_state.use_proxy or
-            prev_proxy_type != st.session_state.proxy_type):
-            changed = True
     
     with col3:
         prev_interval = scheduler_service.get_interval()
@@ -112,9 +128,6 @@ def display_scraper_controls(scheduler_service):
         
         if interval != prev_interval:
             scheduler_service.set_interval(interval)
-            changed = True
-    
-    return changed
 
 def display_scraper_progress(current_url_index, total_urls, scheduler_service):
     """Display improved progress indicators for scraping without duplicate progress bars."""
@@ -137,7 +150,7 @@ def display_scraper_progress(current_url_index, total_urls, scheduler_service):
                      help="Current URL being processed / Total URLs")
         
         # Timeline display
-        next_scrape_in = max(0, scheduler_service.get_next_scrape_time() - time.time())
+        next_scrape_in = scheduler_service.get_time_until_next_scrape()
         
         # Create a visual timeline display instead of a progress bar
         time_info = f"Next scrape in: {int(next_scrape_in)} seconds" if next_scrape_in > 0 else "Scraping now..."
@@ -6,25 +6,55 @@ import base64
 import time
 from pathlib import Path
 
+_SOUNDS_DIR = Path(__file__).parent.parent / "resources" / "sounds"
+_SOUND_PLAY_SECONDS = 2.5  # How long a queued sound is kept on the page
+
+@st.cache_data(show_spinner=False)
+def _load_sound_base64(sound_file):
+    """Read and base64-encode a sound file once; returns None if it doesn't exist."""
+    sound_path = _SOUNDS_DIR / sound_file
+    if not sound_path.exists():
+        return None
+    return base64.b64encode(sound_path.read_bytes()).decode()
+
 def play_sound(sound_file):
     """
-    Play a sound effect using Streamlit's audio component.
+    Queue a sound effect; it's played by render_pending_sound.
+    
+    Pages often rerun right after queuing a sound (st.rerun, autorefresh), which
+    would remove the audio element mid-play, so the sound is kept in the session
+    and re-rendered on every run until it has had time to finish.
     
     Args:
         sound_file: Filename of the sound file in the sounds directory
     """
+    # Check if sound effects are enabled
+    if not st.session_state.get('sound_effects_enabled', True):
+        return
+    st.session_state.pending_sound = (sound_file, time.monotonic() + _SOUND_PLAY_SECONDS)
+
+def render_pending_sound(container):
+    """
+    Render the queued sound effect, if it's still playing.
+    
+    Args:
+        container: Placeholder created at a fixed spot on the page, so the audio
+            element is kept (not restarted) across reruns
+    """
+    pending_sound = st.session_state.get('pending_sound')
+    if pending_sound is None:
+        return
+    
+    sound_file, play_until = pending_sound
+    if time.monotonic() >= play_until:
+        del st.session_state['pending_sound']
+        container.empty()
+        return
+    
     try:
-        # Check if sound effects are enabled
-        if not st.session_state.get('sound_effects_enabled', True):
-            return
-            
-        sound_path = Path(__file__).parent.parent / "resources" / "sounds" / sound_file
-        if sound_path.exists():
-            with open(sound_path, "rb") as audio_file:
-                audio_bytes = audio_file.read()
-            
-            # Use hidden HTML audio for background sound effects
-            audio_base64 = base64.b64encode(audio_bytes).decode()
+        # Use hidden HTML audio for background sound effects
+        audio_base64 = _load_sound_base64(sound_file)
+        if audio_base64 is not None:
             audio_format = "audio/wav" if sound_file.endswith('.wav') else "audio/mpeg"
             
             # Multiple HTML approaches for better browser compatibility
@@ -46,10 +76,9 @@ def play_sound(sound_file):
                 <source src="data:{audio_format};base64,{audio_base64}" type="{audio_format}">
             </audio>
             """
-            st.markdown(audio_html, unsafe_allow_html=True)
-            
-            # Add delay to let sound complete before continuing
-            time.sleep(2.5)  # Allow 2.5 seconds for sound to play completely
+            # Rendering the same element into the same placeholder on each run keeps
+            # it playing instead of blocking the script until the sound has finished
+            container.markdown(audio_html, unsafe_allow_html=True)
             
     except Exception as e:
         # Show error in debug mode
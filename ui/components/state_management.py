@@ -6,8 +6,7 @@ import streamlit as st
 
 def initialize_navigation_state():
     """Initialize navigation state if not already present."""
-    if 'current_page' not in st.session_state:
-        st.session_state.current_page = "🏠 Home"
+    st.session_state.setdefault('current_page', "🏠 Home")
 
 def initialize_scraper_state(url_pool_service):
     """Initialize scraper-related session state."""
@@ -20,6 +19,9 @@ def initialize_scraper_state(url_pool_service):
     if 'auto_send_active' not in st.session_state:
         st.session_state.auto_send_active = False
     
+    if 'combine_messages' not in st.session_state:
+        st.session_state.combine_messages = False
+    
     if 'latest_results' not in st.session_state:
         st.session_state.latest_results = {}
     
@@ -45,9 +47,12 @@ def clear_cache_state():
             del st.session_state[key]
 
 def navigate_to(page):
-    """Navigate to the specified page."""
+    """Navigate to the specified page.
+
+    Meant to be a widget on_click callback: the click's own rerun picks up
+    the new page, so no extra st.rerun() is needed.
+    """
     st.session_state.current_page = page
-    st.rerun()
 
 def set_scraper_state(scraping_active=None, interval=None):
     """Update scraper state variables."""
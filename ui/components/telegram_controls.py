@@ -2,101 +2,109 @@
 Telegram notification components for the VroomSniffer UI.
 """
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
 
-def send_listings_to_telegram(notification_service, listings, progress_container=None, source_description=None):
+def _get_telegram_executor():
+    """Get the session's single-worker executor that sends notifications off the script thread."""
+    if 'telegram_executor' not in st.session_state:
+        st.session_state.telegram_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="telegram-send")
+    return st.session_state.telegram_executor
+
+def start_telegram_job(notification_service, listings):
     """
-    Send listings to Telegram using NotificationService.
+    Queue listings for sending to Telegram in the background.
+    
+    The sends are paced to Telegram's rate limits and can take a while, so they run
+    on their own executor and the page polls them like a scrape job. If a previous
+    send is still running, the new one queues behind it and both are reported
+    together. Listings are combined into fewer messages when the session's
+    "Combine notifications" setting is on.
     
     Args:
         notification_service: Instance of NotificationService
         listings: List of listings to send
-        progress_container: Optional Streamlit container for progress display
-        source_description: Optional description of the source URL
-        
-    Returns:
-        int: Number of successfully sent messages
     """
+    future = _get_telegram_executor().submit(
+        notification_service.manual_send_listings,
+        listings,
+        parse_mode="HTML",
+        retry_on_network_error=True,
+        combine_messages=st.session_state.get('combine_messages', False)
+    )
+    telegram_job = st.session_state.get('telegram_job')
+    if telegram_job is None:
+        st.session_state.telegram_job = {'futures': [future], 'count': len(listings)}
+    else:
+        telegram_job['futures'].append(future)
+        telegram_job['count'] += len(listings)
+
+def _telegram_job_done(telegram_job):
+    return all(future.done() for future in telegram_job['futures'])
+
+def show_telegram_job():
+    """
+    Show the background send status, clearing the job once its result is shown.
+    
+    The caller is responsible for rerunning the page while the job is running.
+    """
+    telegram_job = st.session_state.get('telegram_job')
+    if telegram_job is None:
+        return
+    
+    if not _telegram_job_done(telegram_job):
+        st.info(f"📤 Sending {telegram_job['count']} notifications...")
+        return
+    
+    del st.session_state['telegram_job']
     success_count = 0
+    for future in telegram_job['futures']:
+        try:
+            success_count += future.result()[0]
+        except Exception as e:
+            print(f"[TELEGRAM ERROR] Background send failed: {str(e)}")
     
-    try:
-        # Create progress bar and status message
-        if len(listings) > 1:
-            if progress_container:
-                # Use the provided container
-                progress_bar = progress_container.progress(0, text="Preparing to send messages...")
-                status_text = st.empty()
-            else:
-                # Create new progress indicators
-                progress_bar = st.progress(0, text="Preparing to send messages...")
-                status_text = st.empty()
-            
-            # Create a source info message if provided
-            if source_description:
-                st.info(f"📍 Source: {source_description}")
-            
-            # Set up batching information
-            batch_size = min(15, len(listings))
-            total_batches = -(-len(listings) // batch_size)  # Ceiling division
-            
-            # Define a custom callback to update the UI on progress
-            def progress_callback(sent, total, batch_num=None):
-                progress = sent / total
-                progress_bar.progress(progress)
-                
-                if batch_num is not None:
-                    status_message = f"📤 Batch {batch_num}/{total_batches}: {sent}/{total} messages sent..."
-                    status_text.text(status_message)
-                    # Update the progress bar text too for better visibility
-                    progress_bar.progress(progress, text=f"Sending: {sent}/{total} messages")
-                else:
-                    status_message = f"📤 Sending messages: {sent}/{total} complete..."
-                    status_text.text(status_message)
-                    # Update the progress bar text too
-                    progress_bar.progress(progress, text=f"Sending: {sent}/{total} messages")
-            
-            # Call the notification service with our progress callback
-            success_count, failed = notification_service.manual_send_listings(
-                listings,
-                parse_mode="HTML",
-                retry_on_network_error=True,
-                progress_callback=progress_callback
-            )
-            
-            # Update UI with final status
-            if success_count > 0:
-                progress_bar.progress(1.0)
-                status_text.success(f"✅ Sent {success_count}/{len(listings)} listings to Telegram")
-            
-            if failed:
-                st.error(f"❌ Failed to send {len(failed)} listings")
-        else:
-            # Simple case for a single listing
-            success = notification_service.send_listing(listings[0])
-            success_count = 1 if success else 0
-            
-            if success:
-                st.success("✅ Message sent successfully to Telegram")
-            else:
-                st.error("❌ Failed to send message to Telegram")
-            
-    except Exception as e:
-        st.error(f"❌ Telegram sending failed: {str(e)}")
-        
-    return success_count
+    if success_count > 0:
+        st.success(f"✓ Sent {success_count} notifications")
+    else:
+        st.error("✗ Failed to send notifications")
 
+@st.fragment(run_every=1)
+def _telegram_job_fragment():
+    """Poll the running job each second, rerunning the page once it has finished."""
+    telegram_job = st.session_state.get('telegram_job')
+    if telegram_job is None or _telegram_job_done(telegram_job):
+        st.rerun()
+    st.info(f"📤 Sending {telegram_job['count']} notifications...")
+
+def show_telegram_job_live():
+    """
+    Show the background send status on pages without their own refresh loop.
+    
+    Only a small fragment reruns while the job is running; the result is shown by
+    the full rerun it triggers when the job is done.
+    """
+    telegram_job = st.session_state.get('telegram_job')
+    if telegram_job is None:
+        return
+    if _telegram_job_done(telegram_job):
+        show_telegram_job()
+    else:
+        _telegram_job_fragment()
+
+@st.fragment
 def telegram_test_button(notification_service):
     """
     Clean Telegram test button using the NotificationService.
     
+    Runs as a fragment, so clicking the button only reruns this panel
+    rather than the whole page.
+    
     Args:
         notification_service: Instance of NotificationService
     """
     if st.button("Test Connection", use_container_width=True, 
                 help="Test your Telegram bot connection"):
         with st.spinner("Testing connection..."):
-            import time
-            time.sleep(0.5)
-            
             success, error = notification_service.send_telegram_message(
                 "Test from VroomSniffer! Connection successful!", 
                 parse_mode="HTML"
@@ -3,6 +3,8 @@ Reusable UI components for the VroomSniffer UI.
 """
 import streamlit as st
 
+from ui.components.url_display import save_url_description, pop_description_save_result
+
 def display_url_list(urls, url_pool_service=None, next_url_index=None, is_scraping_active=False, is_next_url_selected=False):
     """
     Display a list of URLs with highlighting for the next URL and metadata.
@@ -60,10 +62,11 @@ def display_url_list(urls, url_pool_service=None, next_url_index=None, is_scrapi
                     st.markdown(f"**Description:** {description}")
                 
                 # Add description input field
-                new_description = st.text_input(
+                description_key = f"desc_{i}_{url[-10:]}"  # Create unique key
+                st.text_input(
                     "Enter or update description",
                     value=description,
-                    key=f"desc_{i}_{url[-10:]}"  # Create unique key
+                    key=description_key
                 )
                 
                 # Control buttons row with save description button, remove from pool, and remove from storage
@@ -71,14 +74,17 @@ def display_url_list(urls, url_pool_service=None, next_url_index=None, is_scrapi
                 
                 # Save button for description
                 with btn_col1:
-                    if st.button("Save Description", key=f"save_{i}_{url[-10:]}"):
-                        if url_pool_service and new_description != description:
-                            if url_pool_service.update_url_description(url, new_description):
-                                # More visible success feedback
-                                st.success("✅ Description saved successfully!", icon="✅")
-                                modified = True
-                            else:
-                                st.error("❌ Failed to update description")
+                    # Saved from the callback so the description above is already current
+                    st.button("Save Description", key=f"save_{i}_{url[-10:]}",
+                              on_click=save_url_description,
+                              args=(url_pool_service, url, description_key, description))
+                    saved = pop_description_save_result(url)
+                    if saved:
+                        # More visible success feedback
+                        st.success("✅ Description saved successfully!", icon="✅")
+                        modified = True
+                    elif saved is not None:
+                        st.error("❌ Failed to update description")
                 
                 # Remove from pool button (only removes from current session)
                 with btn_col2:
@@ -134,29 +140,21 @@ def display_scrape_results(results):
     """
     if not results:
         return
-        
-    result_timestamp = results.get('timestamp', 0)
-    if 'last_displayed_result' not in st.session_state:
-        st.session_state.last_displayed_result = 0
-    
-    if result_timestamp <= st.session_state.last_displayed_result:
-        return
-    
-    st.session_state.last_displayed_result = result_timestamp
     
     st.subheader("📊 Results")
     
     with st.container():
         st.markdown('<div class="status-card">', unsafe_allow_html=True)
         
-        new_listings = results.get('new_listings', [])
+        # latest_results only keeps a sample of the listings, so prefer its count
+        new_count = results.get('new_count', len(results.get('new_listings', [])))
         scraped_url = results.get('url', '')
         url_num = results.get('url_index', 0) + 1
         
         st.write(f"**🔗 URL #{url_num}:** {scraped_url}")
         
-        if new_listings:
-            st.write(f"**✅ Result:** {len(new_listings)} new listings found")
+        if new_count:
+            st.write(f"**✅ Result:** {new_count} new listings found")
         else:
             st.write(f"**🔍 Result:** No new listings found")
         
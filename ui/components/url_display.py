@@ -4,6 +4,90 @@ This module contains improved components for URL display with better NEXT indica
 """
 import streamlit as st
 
+from ui.components.cached_data import file_signature
+
+def save_url_description(url_pool_service, url, input_key, current_description=None):
+    """
+    on_click callback for the Save Description buttons.
+    
+    Callbacks run before the page is drawn, so the URL rows built in that run
+    already show the new description. The outcome is left in session state
+    for the button's row to report.
+    
+    Args:
+        url_pool_service: UrlPoolService instance to save with
+        url: URL whose description is saved
+        input_key: Widget key of the description text input
+        current_description: Skip saving when the input still matches this
+    """
+    new_description = st.session_state.get(input_key, "")
+    if current_description is not None and new_description == current_description:
+        return
+    saved = bool(url_pool_service) and url_pool_service.update_url_description(url, new_description)
+    st.session_state._description_save_result = (url, saved)
+
+def pop_description_save_result(url):
+    """Return whether the last Save Description click for url succeeded, or None if it wasn't clicked."""
+    result = st.session_state.get('_description_save_result')
+    if result is None or result[0] != url:
+        return None
+    del st.session_state['_description_save_result']
+    return result[1]
+
+def _get_url_rows(urls, url_pool_service=None):
+    """
+    Build the per-URL display data (truncated URL, metadata and stats).
+    
+    The result only depends on the URL list and the files the metadata is read
+    from, so it is memoized in session state and rebuilt only when one of those changes.
+    
+    Args:
+        urls: List of URLs to display
+        url_pool_service: UrlPoolService instance to get URL metadata
+        
+    Returns:
+        list: One dict per URL with display_url, description, run_count,
+              total_listings, last_run and bandwidth_stats keys
+    """
+    storage_signature = None
+    bandwidth_signature = None
+    if url_pool_service:
+        storage_signature = file_signature(url_pool_service.get_url_storage_path())
+        if hasattr(url_pool_service, 'storage_service'):
+            bandwidth_signature = file_signature(url_pool_service.storage_service.bandwidth_tracking_path)
+    cache_key = (tuple(urls), storage_signature, bandwidth_signature)
+    
+    cached = st.session_state.get('_url_rows_cache')
+    if cached and cached[0] == cache_key:
+        return cached[1]
+    
+    # Get URL metadata if service is provided
+    url_data = {}
+    if url_pool_service:
+        url_data = url_pool_service.get_url_data()
+    
+    rows = []
+    for url in urls:
+        stats = url_data.get(url, {}).get('stats') or {}
+        
+        # Get bandwidth stats if available
+        bandwidth_stats = None
+        if url_pool_service and hasattr(url_pool_service, 'storage_service'):
+            bandwidth_stats = url_pool_service.storage_service.get_bandwidth_stats_for_url(url)
+        
+        rows.append({
+            # Truncate long URLs for display
+            'display_url': url if len(url) <= 60 else f"{url[:60]}...",
+            'description': url_data.get(url, {}).get('description', ''),
+            'run_count': stats.get('run_count', 0),
+            'total_listings': stats.get('total_listings', 0),
+            'last_run': stats.get('last_run', ''),
+            'bandwidth_stats': bandwidth_stats
+        })
+    
+    st.session_state._url_rows_cache = (cache_key, rows)
+    return rows
+
 def display_url_list_improved(urls, url_pool_service=None, next_url_index=None, is_scraping_active=False, is_next_url_selected=False):
     """
     Display a list of URLs with clear highlighting for the next URL and metadata.
@@ -22,10 +106,7 @@ def display_url_list_improved(urls, url_pool_service=None, next_url_index=None,
         st.info("No URLs in pool. Add URLs to start scraping.")
         return False, None
     
-    # Get URL metadata if service is provided
-    url_data = {}
-    if url_pool_service:
-        url_data = url_pool_service.get_url_data()
+    rows = _get_url_rows(urls, url_pool_service)
     
     modified = False
     removed_index = None
@@ -39,26 +120,13 @@ def display_url_list_improved(urls, url_pool_service=None, next_url_index=None,
                        is_next_url_selected and 
                        i == next_url_index)
         
-        # Truncate long URLs for display
-        display_url = url if len(url) <= 60 else f"{url[:60]}..."
-        
-        # Get metadata if available
-        description = ""
-        run_count = 0
-        total_listings = 0
-        last_run = ""
-        
-        if url in url_data:
-            description = url_data[url].get('description', '')
-            stats = url_data[url].get('stats', {})
-            run_count = stats.get('run_count', 0)
-            total_listings = stats.get('total_listings', 0)
-            last_run = stats.get('last_run', '')
-        
-        # Get bandwidth stats if available
-        bandwidth_stats = None
-        if url_pool_service and hasattr(url_pool_service, 'storage_service'):
-            bandwidth_stats = url_pool_service.storage_service.get_bandwidth_stats_for_url(url)
+        row = rows[i]
+        display_url = row['display_url']
+        description = row['description']
+        run_count = row['run_count']
+        total_listings = row['total_listings']
+        last_run = row['last_run']
+        bandwidth_stats = row['bandwidth_stats']
         
         # Create simple title with minimal indicator for the next URL
         title_prefix = "→ " if highlight_url else ""
@@ -71,20 +139,22 @@ def display_url_list_improved(urls, url_pool_service=None, next_url_index=None,
                 st.markdown(f"**Description:** {description}")
             
             # Description input field
-            new_description = st.text_input(
+            description_key = f"desc_{i}_{url[-10:]}"
+            st.text_input(
                 "Description",
                 value=description,
-                key=f"desc_{i}_{url[-10:]}"
+                key=description_key
             )
             
             # Use a horizontal layout for buttons and stats
             btn1, btn2, btn3, stats1, stats2, stats3 = st.columns([1.2, 1.2, 1.2, 0.8, 0.8, 0.8])
             
             with btn1:
-                if st.button("💾 Save Description", key=f"save_{i}_{url[-10:]}", help="Save the description for this URL"):
-                    if url_pool_service and url_pool_service.update_url_description(url, new_description):
-                        st.success("✓")
-                        modified = True
+                st.button("💾 Save Description", key=f"save_{i}_{url[-10:]}", help="Save the description for this URL",
+                          on_click=save_url_description, args=(url_pool_service, url, description_key))
+                if pop_description_save_result(url):
+                    st.success("✓")
+                    modified = True
             
             with btn2:
                 if st.button("🔄 Remove from Pool", key=f"remove_pool_{i}_{url[-10:]}", 
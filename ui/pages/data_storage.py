@@ -1,19 +1,74 @@
 import streamlit as st
-import sys
-from pathlib import Path
+import heapq
+import numpy as np
 import pandas as pd
 
-# Add the parent directory to the path so we can import from local modules
-sys.path.append(str(Path(__file__).parent.parent.parent))
-
 # Import services via the provider pattern
 from providers.services_provider import (
     get_storage_service,
     get_statistics_service,
     get_notification_service
 )
-from notifier.telegram import send_telegram_message, format_car_listing_message
+from ui.components.cached_data import file_signature, load_all_listings, load_cache_stats
 from ui.components.ip_tracking import display_ip_tracking
+from ui.components.state_management import navigate_to
+from ui.components.telegram_controls import start_telegram_job, show_telegram_job_live
+
+def _build_listings_frame(listings):
+    """Build the Search & Browse table for a list of listings.
+
+    Columns are filled as plain lists and handed to pandas in one go, which
+    skips the per-row dict that a list-of-records frame needs to infer.
+    """
+    titles = []
+    for listing in listings:
+        title = listing.get("Title", "N/A")
+        titles.append(title[:60] + "..." if len(title) > 60 else title)
+    return pd.DataFrame({
+        "Select": [False] * len(titles),
+        "Title": titles,
+        "Price": [listing.get("Price", "N/A") for listing in listings],
+        "Location": [listing.get("Location", "N/A") for listing in listings],
+        "Posted": [listing.get("Posted", "N/A") for listing in listings],
+        "URL": [listing.get("URL", "N/A") for listing in listings]
+    })
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def _all_listings_frame(cache_path, signature):
+    """Browse table for the whole cache, rebuilt only when the cache file changes."""
+    return _build_listings_frame(load_all_listings(cache_path, signature))
+
+def _price_insights(listings):
+    """Everything the Insights tab shows for listings, computed in one pass.
+
+    Only the summary values are returned (not the raw price list), so cached
+    insights stay small to copy out of the cache on every rerun.
+    """
+    statistics_service = get_statistics_service()
+    avg_price, total_count, prices = statistics_service.show_statistics(listings)
+    insights = {
+        'avg_price': avg_price,
+        'total_count': total_count,
+        'price_range': None,
+        'median_price': 0,
+        'chart_data': None,
+        'categories': None,
+        'top_locations': heapq.nlargest(10, statistics_service.analyze_locations(listings).items(), key=lambda x: x[1]),
+    }
+    if prices:
+        price_array = np.asarray(prices)
+        middle = len(prices) // 2
+        insights['price_range'] = (int(price_array.min()), int(price_array.max()))
+        # Upper median, selected in linear time instead of sorting all prices
+        insights['median_price'] = int(np.partition(price_array, middle)[middle])
+        insights['chart_data'] = statistics_service.create_price_distribution_chart(prices, bins=20).set_index('Price Range')
+        insights['categories'] = statistics_service.categorize_prices(prices)
+    return insights
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def _all_listings_insights(cache_path, signature):
+    """Price insights for the whole cache, recomputed only when the cache file changes."""
+    return _price_insights(load_all_listings(cache_path, signature))
 
 def show_data_storage_page(all_old_path, latest_new_path):
     """Data storage page with clean interface for viewing and managing cached data."""
@@ -21,15 +76,14 @@ def show_data_storage_page(all_old_path, latest_new_path):
     st.title("Data Storage & Insights")
     st.write("Search, analyze, and manage your collected car listing data")
     
-    # Check if we have data
-    stats = get_statistics_service().get_cache_stats(all_old_path)
+    # Check if we have data - the cache file's signature keys every cached load below
+    all_old_signature = file_signature(all_old_path)
+    stats = load_cache_stats(str(all_old_path), all_old_signature)
     if stats["total_listings"] == 0:
         st.warning("No cached data found")
         st.info("Use the Scraper page to collect some car listings first!")
         
-        if st.button("Go to Scraper", type="primary"):
-            st.session_state.current_page = "🔍 Scraper"
-            st.rerun()
+        st.button("Go to Scraper", type="primary", on_click=navigate_to, args=("🔍 Scraper",))
         return
     
     # Simple cache overview
@@ -102,27 +156,15 @@ def show_data_storage_page(all_old_path, latest_new_path):
         # Display filtered results
         if 'current_filtered_listings' in st.session_state:
             filtered_listings = st.session_state.current_filtered_listings
+            df = _build_listings_frame(filtered_listings)
         else:
-            # Show all listings by default
-            filtered_listings = get_statistics_service().get_all_cached_listings(all_old_path)
+            # Show all listings by default, rebuilt only when the cache file changes
+            filtered_listings = load_all_listings(str(all_old_path), all_old_signature)
+            df = _all_listings_frame(str(all_old_path), all_old_signature)
         
         if filtered_listings:
             st.info(f"📋 Showing {len(filtered_listings)} listings")
             
-            # Create DataFrame for display
-            listings_data = []
-            for listing in filtered_listings:
-                listings_data.append({
-                    "Select": False,
-                    "Title": listing.get("Title", "N/A")[:60] + "..." if len(listing.get("Title", "")) > 60 else listing.get("Title", "N/A"),
-                    "Price": listing.get("Price", "N/A"),
-                    "Location": listing.get("Location", "N/A"),
-                    "Posted": listing.get("Posted", "N/A"),
-                    "URL": listing.get("URL", "N/A")
-                })
-            
-            df = pd.DataFrame(listings_data)
-            
             # Interactive table
             edited_df = st.data_editor(
                 df,
@@ -144,16 +186,12 @@ def show_data_storage_page(all_old_path, latest_new_path):
                 hide_index=True,
             )
             
-            # Handle selected items
-            selected_urls = []
-            selected_listings = []
-            for idx, row in edited_df.iterrows():
-                if row["Select"]:
-                    selected_urls.append(row["URL"])
-                    for listing in filtered_listings:
-                        if listing.get("URL") == row["URL"]:
-                            selected_listings.append(listing)
-                            break
+            # Handle selected items - rows are fixed and in listing order, so the
+            # Select column lines up with filtered_listings position by position
+            selected_listings = [
+                listing for listing, selected in zip(filtered_listings, edited_df["Select"].tolist()) if selected
+            ]
+            selected_urls = [listing.get("URL", "N/A") for listing in selected_listings]
             
             # Action buttons for selected items
             if selected_urls:
@@ -171,21 +209,8 @@ def show_data_storage_page(all_old_path, latest_new_path):
                 
                 with col2:
                     if st.button(f"📤 Send to Telegram", type="primary"):
-                        with st.spinner(f"Sending {len(selected_listings)} listings..."):
-                            try:
-                                success_count, failed = get_notification_service().manual_send_listings(
-                                    selected_listings,
-                                    send_telegram_message=send_telegram_message,
-                                    format_car_listing_message=format_car_listing_message,
-                                    parse_mode="HTML",
-                                    retry_on_network_error=True
-                                )
-                                if success_count > 0:
-                                    st.success(f"✅ Sent {success_count}/{len(selected_listings)} listings!")
-                                if failed:
-                                    st.error(f"❌ Failed to send {len(failed)} listings!")
-                            except Exception as e:
-                                st.error(f"❌ Failed to send messages: {str(e)}")
+                        # Sent in the background; progress is shown below the table
+                        start_telegram_job(get_notification_service(), selected_listings)
                 
                 with col3:
                     if st.button(f"📊 Analyze Selected", type="secondary"):
@@ -198,12 +223,16 @@ def show_data_storage_page(all_old_path, latest_new_path):
                     st.info(f"Selected: {len(selected_urls)} listings")
         else:
             st.info("No listings match your search criteria.")
+        
+        # Status of a Telegram send started from this page (or still running from another)
+        show_telegram_job_live()
     
     with tab2:
         # Analytics and insights
         st.subheader("📊 Data Insights & Analytics")
         
         # Determine which listings to analyze
+        insights = None
         if 'analysis_listings' in st.session_state and st.session_state.analysis_listings:
             analysis_listings = st.session_state.analysis_listings
             st.info(f"📊 Analytics based on {len(analysis_listings)} selected listings")
@@ -216,41 +245,31 @@ def show_data_storage_page(all_old_path, latest_new_path):
             analysis_listings = st.session_state.current_filtered_listings
             st.info(f"📊 Analytics based on {len(analysis_listings)} filtered results")
         else:
-            analysis_listings = get_statistics_service().get_all_cached_listings(all_old_path)
+            analysis_listings = load_all_listings(str(all_old_path), all_old_signature)
+            insights = _all_listings_insights(str(all_old_path), all_old_signature)
             st.info(f"📊 Analytics based on all {len(analysis_listings)} cached listings")
         
         if analysis_listings:
-            # Show detailed statistics
-            avg_price, total_count, prices = get_statistics_service().show_statistics(analysis_listings)
+            # Show detailed statistics - cached for the whole cache, computed for selections
+            insights = insights or _price_insights(analysis_listings)
+            avg_price = insights['avg_price']
+            price_range = insights['price_range']
+            median_price = insights['median_price']
             
             col1, col2, col3, col4 = st.columns(4)
             with col1:
                 st.metric("Average Price", f"€{avg_price:,}" if avg_price > 0 else "N/A")
             with col2:
-                st.metric("Price Range", f"€{min(prices):,} - €{max(prices):,}" if prices else "N/A")
+                st.metric("Price Range", f"€{price_range[0]:,} - €{price_range[1]:,}" if price_range else "N/A")
             with col3:
-                st.metric("Data Points", f"{total_count:,}")
+                st.metric("Data Points", f"{insights['total_count']:,}")
             with col4:
-                median_price = sorted(prices)[len(prices)//2] if prices else 0
                 st.metric("Median Price", f"€{median_price:,}" if median_price > 0 else "N/A")
             
             # Price distribution chart
-            if prices:
+            if insights['chart_data'] is not None:
                 st.subheader("💰 Price Distribution")
-                df_prices = pd.DataFrame({"Price": prices})
-                
-                # Create bins for better visualization
-                bins = 20
-                hist_data = pd.cut(df_prices["Price"], bins=bins, include_lowest=True)
-                hist_counts = hist_data.value_counts().sort_index()
-                
-                # Convert to chart-friendly format
-                chart_data = pd.DataFrame({
-                    'Price Range': [f"€{int(interval.left):,}-€{int(interval.right):,}" for interval in hist_counts.index],
-                    'Count': hist_counts.values
-                })
-                
-                st.bar_chart(chart_data.set_index('Price Range'))
+                st.bar_chart(insights['chart_data'])
             
             # Additional insights
             st.subheader("🔍 Additional Insights")
@@ -259,28 +278,19 @@ def show_data_storage_page(all_old_path, latest_new_path):
             
             with col1:
                 # Location analysis
-                locations = {}
-                for listing in analysis_listings:
-                    location = listing.get("Location", "Unknown")
-                    locations[location] = locations.get(location, 0) + 1
-                
-                if locations:
+                if insights['top_locations']:
                     st.write("**Top Locations:**")
-                    sorted_locations = sorted(locations.items(), key=lambda x: x[1], reverse=True)[:10]
-                    for location, count in sorted_locations:
+                    for location, count in insights['top_locations']:
                         st.write(f"• {location}: {count} listings")
             
             with col2:
                 # Price categories
-                if prices:
-                    low_price = len([p for p in prices if p < 10000])
-                    mid_price = len([p for p in prices if 10000 <= p < 25000])
-                    high_price = len([p for p in prices if p >= 25000])
-                    
+                categories = insights['categories']
+                if categories:
                     st.write("**Price Categories:**")
-                    st.write(f"• Budget (< €10k): {low_price} listings")
-                    st.write(f"• Mid-range (€10k-€25k): {mid_price} listings")
-                    st.write(f"• Premium (> €25k): {high_price} listings")
+                    st.write(f"• Budget (< €10k): {categories['low']} listings")
+                    st.write(f"• Mid-range (€10k-€25k): {categories['mid']} listings")
+                    st.write(f"• Premium (> €25k): {categories['high']} listings")
         else:
             st.info("No data available for analytics")
             
@@ -1,11 +1,5 @@
 ﻿import streamlit as st
-import sys
-import os
 import time
-from pathlib import Path
-
-# Add the parent directory to the path so we can import from local modules
-sys.path.append(str(Path(__file__).parent.parent.parent))
 
 # Import services via the new services_provider
 from providers.services_provider import get_storage_service
@@ -13,6 +7,7 @@ from providers.services_provider import get_storage_service
 from ui.components.metrics import display_metrics_row
 from ui.components.navigation import create_navigation_cards
 from ui.components.error_handling import handle_error
+from ui.components.cached_data import file_signature, load_cache_stats
 
 @handle_error
 def show_home_page(all_old_path, latest_new_path):
@@ -25,13 +20,16 @@ def show_home_page(all_old_path, latest_new_path):
     
     # Simple metrics
     try:
-        stats = storage_service.get_cache_stats(all_old_path)
-        recent_listings = storage_service.load_cache(latest_new_path) if latest_new_path else {}
+        # Parsing the whole cache is only needed when the file has changed
+        all_old_signature = file_signature(all_old_path)
+        stats = load_cache_stats(str(all_old_path), all_old_signature)
+        # Only the count is shown, so don't build the full cache dict
+        recent_count = storage_service.count_listings(latest_new_path) if latest_new_path else 0
         
         # Prepare metrics data
         metrics_data = [
             {'label': 'Total Listings', 'value': stats["total_listings"]},
-            {'label': 'Recent Additions', 'value': len(recent_listings) if recent_listings else 0},
+            {'label': 'Recent Additions', 'value': recent_count},
         ]
         
         # Add cache size metric
@@ -43,9 +41,8 @@ def show_home_page(all_old_path, latest_new_path):
         
         # Prepare the last column with update time info
         last_updated = "Never"
-        if all_old_path and os.path.exists(all_old_path):
-            modified_time = os.path.getmtime(all_old_path)
-            hours_ago = int((time.time() - modified_time) / 3600)
+        if all_old_signature is not None:
+            hours_ago = int((time.time() - all_old_signature[0] / 1e9) / 3600)
             if hours_ago == 0:
                 last_updated = "< 1 hour ago"
             elif hours_ago < 24:
@@ -122,8 +119,8 @@ def show_home_page(all_old_path, latest_new_path):
         if stats.get("total_listings", 0) > 0:
             st.write("Your current data:")
             st.write(f"• {stats['total_listings']} total listings cached")
-            if recent_listings:
-                st.write(f"• {len(recent_listings)} recent additions")
+            if recent_count:
+                st.write(f"• {recent_count} recent additions")
             else:
                 st.write("• No recent additions")
         else:
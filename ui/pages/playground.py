@@ -1,9 +1,4 @@
 import streamlit as st
-import sys
-from pathlib import Path
-
-# Add the parent directory to the path so we can import from local modules
-sys.path.append(str(Path(__file__).parent.parent.parent))
 
 # Import services and components
 from providers.services_provider import get_notification_service
@@ -39,9 +34,6 @@ def show_playground_page(all_old_path, latest_new_path, root_dir):
         
         if test_scrape_btn and test_url:
             with st.spinner("Testing URL scraping..."):
-                import time
-                time.sleep(1)  # Simulate testing
-                
                 st.success("Test Successful! URL is valid and ready for scraping.")
                 
                 with st.expander("URL Analysis Details", expanded=True):
@@ -85,9 +77,6 @@ def show_playground_page(all_old_path, latest_new_path, root_dir):
         with col2:
             if st.button("Test Filter Configuration", type="primary", use_container_width=True):
                 with st.spinner("Testing filter configuration..."):
-                    import time
-                    time.sleep(1)
-                    
                     st.success("Filter configuration validated successfully!")
                     
                     with st.expander("Applied Filters", expanded=True):
@@ -1,11 +1,11 @@
 import streamlit as st
-import sys
-import json
 import time
+import queue
+import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-
-# Add the parent directory to the path so we can import from local modules
-sys.path.append(str(Path(__file__).parent.parent.parent))
+from streamlit_autorefresh import st_autorefresh
 
 # Import services via the provider pattern
 from providers.services_provider import (
@@ -17,14 +17,14 @@ from providers.services_provider import (
 )
 
 # Import UI components
-from ui.components.sound_effects import play_sound
+from ui.components.sound_effects import play_sound, render_pending_sound
+from ui.components.cached_data import file_signature, load_ip_tracking
 from ui.components.ui_components import display_scrape_results
-from ui.components.metrics import display_metrics_row
+from ui.components.metrics import display_metrics_card
 from ui.components.state_management import initialize_scraper_state
-from ui.components.styles import get_main_styles
-from ui.components.telegram_controls import send_listings_to_telegram
 from ui.components.url_management import display_url_management
-from ui.components.scraper_controls import display_scraper_controls, display_scraper_progress
+from ui.components.scraper_controls import display_scraper_controls
+from ui.components.telegram_controls import start_telegram_job, show_telegram_job
 
 # Initialize services via the provider
 storage_service = get_storage_service()
@@ -34,46 +34,173 @@ scheduler_service = get_scheduler_service()
 
 # We'll initialize scraper_service with proxy settings from session state when needed
 
+# Maximum number of listings kept in st.session_state.latest_results
+LATEST_RESULTS_SAMPLE_SIZE = 50
+
+# Written by the scraper on every run; the path itself never changes
+_IP_TRACKING_PATH = Path(__file__).resolve().parent.parent.parent / "storage" / "ip_tracking.json"
+
+# Keep-alive session for the direct IP probe so repeated lookups reuse the TLS connection
+_ip_probe_session = requests.Session()
+_ip_probe_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _get_direct_ip():
+    """Get the direct (non-proxy) IP, cached so it is fetched at most once per 10 minutes."""
+    try:
+        direct_response = _ip_probe_session.get("https://api.ipify.org", timeout=3)
+        return direct_response.text.strip()
+    except Exception as e:
+        print(f"[IP INFO ERROR] Failed to get direct IP: {str(e)}")
+        # Cache the failure too so the lookup isn't retried on every scrape
+        return "Unknown"
+
 def _show_system_status():
     """Display simplified system status."""
     st.subheader("System Status")
     
-    # Get minimal data
-    try:
-        import os
-        
-        # Get cache stats from session state paths
-        all_old_path = st.session_state.get('all_old_path')
-        latest_new_path = st.session_state.get('latest_new_path')
-        
-        total_listings = 0
-        recent_additions = 0
-        
-        if all_old_path and os.path.exists(all_old_path):
-            stats = storage_service.get_cache_stats(all_old_path)
-            total_listings = stats.get('total_listings', 0)
+    # Get cache stats from session state paths
+    all_old_path = st.session_state.get('all_old_path')
+    latest_new_path = st.session_state.get('latest_new_path')
+    
+    # The counts only change when one of the cache files is written, so reuse the
+    # last counts while neither file's signature has changed
+    status_key = (file_signature(all_old_path), file_signature(latest_new_path))
+    cached = st.session_state.get('_sys_status_cache')
+    if cached is not None and cached[0] == status_key:
+        total_listings, recent_additions = cached[1]
+    else:
+        # Only the counts are needed here, so skip building the full caches
+        try:
+            total_listings = storage_service.count_listings(all_old_path) if status_key[0] else 0
+            recent_additions = storage_service.count_listings(latest_new_path) if status_key[1] else 0
+        except Exception:
+            total_listings = 0
+            recent_additions = 0
         
-        if latest_new_path and os.path.exists(latest_new_path):
-            recent_data = storage_service.load_cache(latest_new_path)
-            recent_additions = len(recent_data) if recent_data else 0
-            
-    except Exception:
-        total_listings = 0
-        recent_additions = 0
+        st.session_state._sys_status_cache = (status_key, (total_listings, recent_additions))
 
-    # Simplified metrics
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Total Listings", total_listings)
-    with col2:
-        st.metric("Recent New", recent_additions)
-    with col3:
-        st.metric("Runs", scheduler_service.get_total_runs())
+    # Simplified metrics, rendered as one element since this reruns every second while scraping
+    display_metrics_card([
+        {'label': 'Total Listings', 'value': total_listings},
+        {'label': 'Recent New', 'value': recent_additions},
+        {'label': 'Runs', 'value': scheduler_service.get_total_runs()}
+    ])
         
     # Simple status message
     status = "Active" if scheduler_service.is_scraping_active() else "Stopped"
     st.caption(f"Status: {status} | URLs: {len(st.session_state.url_pool)}")
 
+def _get_scrape_executor():
+    """Get the session's single-worker executor that runs scrapes off the script thread."""
+    if 'scrape_executor' not in st.session_state:
+        st.session_state.scrape_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scraper")
+    return st.session_state.scrape_executor
+
+def _start_scrape_job(all_old_path, latest_new_path, root_dir):
+    """
+    Submit a scrape of the pre-selected URL to the background executor.
+    
+    Streamlit calls are not allowed from the worker thread, so scraper progress is
+    pushed onto a queue that the page drains on each rerun.
+    
+    Returns:
+        dict: The job state, also stored in st.session_state.scrape_job
+    """
+    # Use pre-selected URL from scheduler
+    next_url_index = scheduler_service.get_next_url_index()
+    if next_url_index < len(st.session_state.url_pool):
+        current_url_index = next_url_index
+    else:
+        current_url_index = 0
+    
+    current_url = st.session_state.url_pool[current_url_index]
+    
+    # Get URL description if available
+    url_description = ""
+    url_data = url_pool_service.get_url_data()
+    if current_url in url_data:
+        url_description = url_data[current_url].get('description', '')
+    
+    # Define filters for the current URL
+    filters = {"custom_url": current_url}
+    
+    # Initialize scraper service with proxy settings from session state
+    use_proxy = st.session_state.get('use_proxy', False)
+    proxy_type = st.session_state.get('proxy_type', 'NONE')
+    # The provider keeps one instance per proxy configuration across reruns
+    scraper_service = get_scraper_service(use_proxy=use_proxy, proxy_type=proxy_type)
+    
+    progress_queue = queue.Queue()
+    last_sent = {'step': None, 'progress': 0.0, 'at': 0.0}
+    
+    def scraper_progress_callback(step, message, progress_value):
+        # Runs on the worker thread - only hand the progress over to the page when
+        # the step changed, or progress moved noticeably and 250ms have passed
+        now = time.monotonic()
+        if step == last_sent['step'] and (
+                progress_value - last_sent['progress'] < 0.05 or now - last_sent['at'] < 0.25):
+            return
+        last_sent['step'] = step
+        last_sent['progress'] = progress_value
+        last_sent['at'] = now
+        progress_queue.put((step, progress_value))
+    
+    future = _get_scrape_executor().submit(
+        scraper_service.get_listings_for_filter,
+        filters,
+        url_pool_service.build_search_url_from_custom,
+        all_old_path,
+        latest_new_path,
+        root_dir,
+        progress_callback=scraper_progress_callback
+    )
+    
+    st.session_state.scrape_job = {
+        'future': future,
+        'progress_queue': progress_queue,
+        'last_progress': (None, 0.0),
+        'timestamp': time.time(),
+        'url': current_url,
+        'url_index': current_url_index,
+        'url_count': len(st.session_state.url_pool),
+        'url_description': url_description,
+        # Direct IP is only shown next to a proxy IP, so skip the lookup for direct scrapes
+        'direct_ip': _get_direct_ip() if use_proxy else "Unknown"
+    }
+    return st.session_state.scrape_job
+
+def _show_scrape_progress(scrape_job, scrape_log):
+    """Drain progress reported by the scraper thread and show only the latest update."""
+    progress_queue = scrape_job['progress_queue']
+    while not progress_queue.empty():
+        scrape_job['last_progress'] = progress_queue.get_nowait()
+    
+    # Only show essential steps, replacing the single log line rather than appending
+    step, progress_value = scrape_job['last_progress']
+    percent = int(progress_value * 100)
+    if step == "parse":
+        scrape_log.info(f"🔍 Extracting listings... ({percent}%)")
+    elif step == "complete":
+        scrape_log.info("✅ Scraping complete!")
+    else:
+        scrape_log.info(f"🔧 Scraping in progress... ({percent}%)")
+
+@st.fragment(run_every=1)
+def _timer_fragment():
+    """Show the countdown to the next scrape, rerunning the whole page when it is due."""
+    if not scheduler_service.is_scraping_active():
+        return
+    
+    # A single caption for a minimal timer without progress duplication
+    next_scrape_in = scheduler_service.get_time_until_next_scrape()
+    if next_scrape_in <= 0:
+        st.caption("⏱️ Preparing next scrape...")
+        if 'scrape_job' not in st.session_state:
+            st.rerun()
+    else:
+        st.caption(f"⏱️ Next scrape in {int(next_scrape_in)} seconds")
+
 def show_scraper_page(all_old_path, latest_new_path, root_dir):
     """Multi-URL scraper with clean interface."""
     
@@ -81,8 +208,9 @@ def show_scraper_page(all_old_path, latest_new_path, root_dir):
     st.session_state.all_old_path = all_old_path
     st.session_state.latest_new_path = latest_new_path
     
-    # Apply centralized styles from components
-    st.markdown(get_main_styles(), unsafe_allow_html=True)
+    # Fixed spot for sound effects, filled at the end of the run once every
+    # sound for this run has been queued
+    sound_slot = st.empty()
     
     # Use the state management component for consistent initialization
     initialize_scraper_state(url_pool_service)
@@ -114,124 +242,69 @@ def show_scraper_page(all_old_path, latest_new_path, root_dir):
     
     st.divider()
     
-    # URL Management using component
-    url_pool_modified = display_url_management(url_pool_service, scheduler_service)
-    if url_pool_modified:
-        st.rerun()  # Refresh the UI if URLs were modified
+    # URL Management using component - the pool list is rendered below its buttons,
+    # so changes already show up in this run without forcing a second one
+    display_url_management(url_pool_service, scheduler_service)
     
     st.divider()
     
-    # Controls using component
-    controls_changed = display_scraper_controls(scheduler_service)
-    if controls_changed:
-        st.rerun()  # Refresh the UI if controls were changed
+    # Controls using component - settings widgets already trigger their own rerun
+    display_scraper_controls(scheduler_service)
     
-    # Active Scraping Logic
-    if scheduler_service.is_scraping_active() and st.session_state.url_pool:
+    # Active Scraping Logic - the scrape itself runs on a background thread so the
+    # page stays responsive; every rerun polls the job until it has finished
+    scrape_job = st.session_state.get('scrape_job')
+    if scrape_job is None and scheduler_service.is_scraping_active() and st.session_state.url_pool:
         if scheduler_service.is_time_to_scrape():
-            current_time = time.time()
-            
-            # Use pre-selected URL from scheduler
-            next_url_index = scheduler_service.get_next_url_index()
-            if next_url_index < len(st.session_state.url_pool):
-                current_url_index = next_url_index
-            else:
-                current_url_index = 0
-            
-            current_url = st.session_state.url_pool[current_url_index]
-            
-            # Create a SINGLE status container to avoid multiple Streamlit element updates
-            scrape_container_placeholder = st.container()
-            
-            # Get URL description if available
-            url_description = ""
-            url_data = url_pool_service.get_url_data()
-            if current_url in url_data:
-                url_description = url_data[current_url].get('description', '')
-                
-            # Scraping phase - create a cleaner header
-            scrape_header = f"URL #{current_url_index + 1} of {len(st.session_state.url_pool)}: {current_url[:50]}..."
+            scrape_job = _start_scrape_job(all_old_path, latest_new_path, root_dir)
+    
+    if scrape_job is not None:
+        current_time = scrape_job['timestamp']
+        current_url = scrape_job['url']
+        current_url_index = scrape_job['url_index']
+        url_description = scrape_job['url_description']
+        direct_ip = scrape_job['direct_ip']
+        
+        # Single container for all scraper output - CLI style
+        scrape_container = st.container()
+        with scrape_container:
+            st.subheader(f"Scraping URL {current_url_index + 1}/{scrape_job['url_count']}")
             if url_description:
-                scrape_header = f"{url_description} - {scrape_header}"
-                
-            # Single container for all scraper output - CLI style
-            scrape_container = st.container()
-            with scrape_container:
-                st.subheader(f"Scraping URL {current_url_index + 1}/{len(st.session_state.url_pool)}")
-                if url_description:
-                    st.caption(url_description)
-                
-                # Log area for scraper output
-                scrape_log = st.empty()
+                st.caption(url_description)
             
-            # Define filters for the current URL
-            filters = {"custom_url": current_url}
+            # Log area for scraper output
+            scrape_log = st.empty()
+        
+        # Show the latest step reported by the scraper thread
+        _show_scrape_progress(scrape_job, scrape_log)
+        
+        if scrape_job['future'].done():
+            del st.session_state['scrape_job']
             
             try:
-                # Define simple progress callback with minimal status updates
-                def scraper_progress_callback(step, message, progress_value):
-                    # Only show essential steps to minimize UI updates
-                    if step == "init":
-                        scrape_log.info("🔧 Scraping in progress...")
-                    elif step == "parse":
-                        scrape_log.info("🔍 Extracting listings...")
-                    elif step == "complete":
-                        scrape_log.info("✅ Scraping complete!")
-                
-                # Initialize scraper service with proxy settings from session state
-                use_proxy = st.session_state.get('use_proxy', False)
-                proxy_type = st.session_state.get('proxy_type', 'NONE')
-                scraper_service = get_scraper_service(use_proxy=use_proxy, proxy_type=proxy_type)
-                
-                # Log proxy settings for debugging
-                import requests
-                from proxy.manager import ProxyManager, ProxyType
-                
-                # Get direct IP for comparison (but don't show it yet)
-                direct_ip = "Unknown"
-                try:
-                    direct_response = requests.get("https://api.ipify.org", timeout=10)
-                    direct_ip = direct_response.text.strip()
-                except Exception as e:
-                    print(f"[IP INFO ERROR] Failed to get direct IP: {str(e)}")
-                
-                # Use our ScraperService instance with proxy settings
-                results = scraper_service.get_listings_for_filter(
-                    filters,
-                    url_pool_service.build_search_url_from_custom,
-                    all_old_path, 
-                    latest_new_path,
-                    root_dir,
-                    progress_callback=scraper_progress_callback
-                )
-                
-                # Unpack results - now it includes used_ip and is_proxy_used
-                all_listings, new_listings = results
+                # Unpack results from the background scrape (re-raises scraper errors)
+                all_listings, new_listings = scrape_job['future'].result()
                 
                 # Try to get the actual IP used for scraping from ip_tracking.json
-                import json
-                from pathlib import Path
-                
+                ip_info = None
                 try:
-                    ip_tracking_path = Path(__file__).parent.parent.parent / "storage" / "ip_tracking.json"
-                    if ip_tracking_path.exists():
-                        with open(ip_tracking_path, "r", encoding="utf-8") as f:
-                            tracking_data = json.load(f)
+                    ip_tracking_signature = file_signature(_IP_TRACKING_PATH)
+                    if ip_tracking_signature is not None:
+                        tracking_data = load_ip_tracking(str(_IP_TRACKING_PATH), ip_tracking_signature)
+                        
+                        # Check if we have data for the current URL
+                        ip_entries = tracking_data.get("url_ip_mapping", {}).get(current_url)
+                        if ip_entries:
+                            # The storage service keeps entries ordered by last use, so the
+                            # most recent one (the one we just used) is always last
+                            latest_entry = ip_entries[-1]
+                            used_ip = latest_entry.get("ip", "Unknown")
+                            is_proxy_used = latest_entry.get("is_proxy", False)
                             
-                            # Check if we have data for the current URL
-                            if current_url in tracking_data.get("url_ip_mapping", {}):
-                                ip_entries = tracking_data["url_ip_mapping"][current_url]
-                                if ip_entries:
-                                    # Get the most recent IP entry (should be the one we just used)
-                                    latest_entry = max(ip_entries, key=lambda x: x.get("last_used", ""))
-                                    used_ip = latest_entry.get("ip", "Unknown")
-                                    is_proxy_used = latest_entry.get("is_proxy", False)
-                                    last_used = latest_entry.get("last_used", "Unknown time")
-                                    
-                                    # Update IP information in a single message
-                                    ip_info = f"Used {'proxy' if is_proxy_used else 'direct'} IP: {used_ip}"
-                                    if is_proxy_used and direct_ip != "Unknown":
-                                        ip_info += f" (Your direct IP: {direct_ip})"
+                            # Update IP information in a single message
+                            ip_info = f"Used {'proxy' if is_proxy_used else 'direct'} IP: {used_ip}"
+                            if is_proxy_used and direct_ip != "Unknown":
+                                ip_info += f" (Your direct IP: {direct_ip})"
                 except Exception as e:
                     print(f"[UI ERROR] Could not retrieve IP tracking info: {str(e)}")
                 
@@ -242,59 +315,32 @@ def show_scraper_page(all_old_path, latest_new_path, root_dir):
                 else:
                     result_msg = "⚠️ No listings found"
                 
-                # Show final results with IP info in one concise status message
-                if 'ip_info' in locals():
-                    scrape_log.success(f"{result_msg}\n{ip_info}")
+                # Show final results with IP info in one concise status message,
+                # replacing the progress line instead of adding another element
+                scrape_log.success(f"{result_msg}\n{ip_info}" if ip_info else result_msg)
                 
                 # Play sound when new listings are found
                 if new_listings:
                     play_sound("Sniff1.wav")
                 
+                # Keep only counts and a bounded sample in the session - the full
+                # listings are already persisted by the storage service
                 st.session_state.latest_results = {
-                    'all_listings': all_listings,
-                    'new_listings': new_listings,
+                    'all_count': len(all_listings),
+                    'new_count': len(new_listings),
+                    'all_listings': all_listings[:LATEST_RESULTS_SAMPLE_SIZE],
+                    'new_listings': new_listings[:LATEST_RESULTS_SAMPLE_SIZE],
                     'timestamp': current_time,
                     'url': current_url,
                     'url_index': current_url_index,
                     'url_description': url_description
                 }
                 
-                # Auto-send if enabled (simplified)
+                # Auto-send if enabled - queued in the background so the page stays
+                # responsive; source_url is already set on every listing by
+                # ScraperService.get_listings_for_filter
                 if st.session_state.auto_send_active and new_listings:
-                    # Add source URL information for notifications
-                    for listing in new_listings:
-                        if 'source_url' not in listing:
-                            listing['source_url'] = current_url
-                    
-                    # Simple notification message without progress
-                    notify_msg = st.empty()
-                    notify_msg.info(f"📤 Sending {len(new_listings)} notifications...")
-                    
-                    # Send notifications without progress tracking
-                    success_count = send_listings_to_telegram(
-                        notification_service, 
-                        new_listings, 
-                        progress_container=None,  # No progress bar
-                        source_description=url_description
-                    )
-                    
-                    # Update with final result
-                    if success_count > 0:
-                        notify_msg.success(f"✓ Sent {success_count} notifications")
-                    else:
-                        notify_msg.error("✗ Failed to send notifications")
-                        
-                # Simple results display
-                if all_listings:
-                    # Create a consistent results container
-                    results_container = st.container()
-                    with results_container:
-                        # Add collapsible section for listings
-                        with st.expander("See results"):
-                            display_scrape_results({
-                                'all_listings': all_listings,
-                                'new_listings': new_listings
-                            })
+                    start_telegram_job(notification_service, new_listings)
                 
                 # Update counters using scheduler service
                 total_runs = scheduler_service.record_scrape()
@@ -313,18 +359,28 @@ def show_scraper_page(all_old_path, latest_new_path, root_dir):
                 scrape_log.error(f"❌ Scraping failed: {str(e)}")
                 st.session_state.last_scrape_time = current_time
 
-    # Display active scraper status and timer
+    # Results of the last scrape, rendered on every run from the session snapshot.
+    # The expander body would run even while collapsed, so it is only built when
+    # the user has asked to see the results
+    latest_results = st.session_state.get('latest_results')
+    if latest_results and latest_results.get('all_count'):
+        if st.toggle("Show results", key="show_scrape_results"):
+            with st.expander("See results", expanded=True):
+                display_scrape_results(latest_results)
+
+    # Status of the background auto-send, if one is running or just finished
+    show_telegram_job()
+
+    # Display active scraper status and timer. Only the timer fragment reruns each
+    # second; it triggers a full rerun once the next scrape is due
     if scheduler_service.is_scraping_active():
-        # Create a dedicated container for a minimal timer without progress duplication
-        timer_container = st.container()
-        with timer_container:
-            # We'll only show a simple "next scrape" timer here without duplicating the progress metrics
-            next_scrape_in = max(0, scheduler_service.get_next_scrape_time() - time.time())
-            if next_scrape_in <= 0:
-                st.caption("⏱️ Preparing next scrape...")
-            else:
-                st.caption(f"⏱️ Next scrape in {int(next_scrape_in)} seconds")
-        
-        # Auto-refresh if scraping is active
-        time.sleep(1)  # Reduced refresh time for more responsive UI
-        st.rerun()
+        _timer_fragment()
+    
+    # Poll the background scrape and auto-send while they are still running. The
+    # refresh is triggered from the browser, so the script thread is free while waiting.
+    if 'scrape_job' in st.session_state or 'telegram_job' in st.session_state:
+        st_autorefresh(interval=1000, key="scraper_tick")
+    
+    # Play queued sounds (start, new listings); the element is kept across reruns
+    # until the sound has finished
+    render_pending_sound(sound_slot)
@@ -1,20 +1,70 @@
 import streamlit as st
+import importlib
 import sys
+import threading
 from pathlib import Path
 
 # Add the parent directory to the path so we can import from local modules
-sys.path.append(str(Path(__file__).parent.parent))
-
-# Import page modules
-from ui.pages.home import show_home_page
-from ui.pages.scraper import show_scraper_page
-from ui.pages.data_storage import show_data_storage_page
-from ui.pages.playground import show_playground_page
+_root = str(Path(__file__).parent.parent)
+if _root not in sys.path:
+    sys.path.insert(0, _root)
 
 # Import components
 from ui.components.styles import get_main_styles
 from ui.components.state_management import initialize_navigation_state, navigate_to
 
+# Sidebar navigation entries: (page name, button key)
+PAGES = (
+    ("🏠 Home", "nav_home"),
+    ("🔍 Scraper", "nav_scraper"),
+    ("📊 Data Storage", "nav_data"),
+    ("🎮 Playground", "nav_playground"),
+)
+
+# Page routing: page name -> (module, render function, takes root_dir).
+# Modules are imported on first visit so startup only pays for the page shown.
+_ROUTES = {
+    "🏠 Home": ("ui.pages.home", "show_home_page", False),
+    "🔍 Scraper": ("ui.pages.scraper", "show_scraper_page", True),
+    "📊 Data Storage": ("ui.pages.data_storage", "show_data_storage_page", False),
+    "🎮 Playground": ("ui.pages.playground", "show_playground_page", True),
+}
+
+@st.cache_resource
+def _setup_paths():
+    """Create the storage directory once per process and return the shared paths.
+
+    Returns:
+        tuple: (root_dir, all_old_path, latest_new_path)
+    """
+    root_dir = Path(__file__).parent.parent
+    storage_dir = root_dir / "storage"
+    storage_dir.mkdir(parents=True, exist_ok=True)
+    return root_dir, storage_dir / "all_old_results.json", storage_dir / "latest_new_results.json"
+
+@st.cache_resource
+def _logo_bytes():
+    """Read the sidebar logo once per process; None if the file is missing."""
+    try:
+        return (Path(__file__).parent / "resources" / "logo6.png").read_bytes()
+    except OSError:
+        return None
+
+def _import_pages():
+    """Import every page module; failures surface later on the real visit."""
+    for module_name, _, _ in _ROUTES.values():
+        try:
+            importlib.import_module(module_name)
+        except Exception as e:
+            print(f"[APP] Page preload failed for {module_name}: {e}")
+
+@st.cache_resource
+def _preload_pages():
+    """Warm the remaining page imports in a background thread, once per process."""
+    thread = threading.Thread(target=_import_pages, name="page-preload", daemon=True)
+    thread.start()
+    return thread
+
 def main():
     """Main multi-page Streamlit application."""
     st.set_page_config(
@@ -28,12 +78,7 @@ def main():
     st.markdown(get_main_styles(), unsafe_allow_html=True)
     
     # Setup paths - use the same storage directory as scraper and CLI
-    root_dir = Path(__file__).parent.parent
-    storage_dir = root_dir / "storage"
-    storage_dir.mkdir(parents=True, exist_ok=True)
-    
-    all_old_path = storage_dir / "all_old_results.json"
-    latest_new_path = storage_dir / "latest_new_results.json"
+    root_dir, all_old_path, latest_new_path = _setup_paths()
     
     # Initialize navigation state
     initialize_navigation_state()
@@ -41,43 +86,36 @@ def main():
     # Sidebar navigation
     with st.sidebar:
         # Add VroomSniffer logo
-        try:
-            st.image("ui/resources/logo6.png", width=200)
-        except Exception:
+        logo = _logo_bytes()
+        if logo:
+            st.image(logo, width=200)
+        else:
             # Fallback if logo not found
             st.title("VroomSniffer")
         
         st.divider()
         
-        # Navigation buttons
-        if st.button("🏠 Home", key="nav_home", use_container_width=True, 
-                    type="primary" if st.session_state.current_page == "🏠 Home" else "secondary"):
-            navigate_to("🏠 Home")
-            
-        if st.button("🔍 Scraper", key="nav_scraper", use_container_width=True, 
-                    type="primary" if st.session_state.current_page == "🔍 Scraper" else "secondary"):
-            navigate_to("🔍 Scraper")
-            
-        if st.button("📊 Data Storage", key="nav_data", use_container_width=True, 
-                    type="primary" if st.session_state.current_page == "📊 Data Storage" else "secondary"):
-            navigate_to("📊 Data Storage")
-            
-        if st.button("🎮 Playground", key="nav_playground", use_container_width=True, 
-                    type="primary" if st.session_state.current_page == "🎮 Playground" else "secondary"):
-            navigate_to("🎮 Playground")
+        # Navigation buttons - the click callback sets the page before the rerun,
+        # so the highlighted button and the routed page agree without a second run
+        for page_name, button_key in PAGES:
+            st.button(page_name, key=button_key, use_container_width=True,
+                      type="primary" if st.session_state.current_page == page_name else "secondary",
+                      on_click=navigate_to, args=(page_name,))
         
         st.divider()
         st.caption("VroomSniffer v1.0")
     
     # Page routing
-    if st.session_state.current_page == "🏠 Home":
-        show_home_page(all_old_path, latest_new_path)
-    elif st.session_state.current_page == "🔍 Scraper":
-        show_scraper_page(all_old_path, latest_new_path, root_dir)
-    elif st.session_state.current_page == "📊 Data Storage":
-        show_data_storage_page(all_old_path, latest_new_path)
-    elif st.session_state.current_page == "🎮 Playground":
-        show_playground_page(all_old_path, latest_new_path, root_dir)
+    module_name, func_name, takes_root = _ROUTES.get(st.session_state.current_page, _ROUTES["🏠 Home"])
+    show_page = getattr(importlib.import_module(module_name), func_name)
+    if takes_root:
+        show_page(all_old_path, latest_new_path, root_dir)
+    else:
+        show_page(all_old_path, latest_new_path)
+    
+    # Once the first page is on screen, import the others so the first visit
+    # to them doesn't stall on pandas/requests imports
+    _preload_pages()
 
 if __name__ == "__main__":
     main()